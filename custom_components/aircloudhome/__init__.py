@@ -21,13 +21,31 @@
 import homeassistant.helpers.config_validation as cv
 from homeassistant.loader import async_get_loaded_integration
 
-from .api import AirCloudHomeApiClient
-from .const import CONF_UPDATE_INTERVAL_MINUTES, DEFAULT_UPDATE_INTERVAL_MINUTES, DOMAIN, LOGGER
-from .coordinator import AirCloudHomeDataUpdateCoordinator
-from .data import AirCloudHomeData
+from .api import AirCloudHomeApiClient, AirCloudHomeRateLimiter, RequestKind
+from .auth import AirCloudHomeTokenRefreshScheduler, AirCloudHomeTokenStore
+from .const import (
+    CONF_AUTH_REQUESTS_PER_MINUTE,
+    CONF_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+    CONF_READ_REQUESTS_PER_MINUTE,
+    CONF_TOKEN_REFRESH_PERCENT,
+    CONF_UPDATE_INTERVAL_MINUTES,
+    CONF_WRITE_REQUESTS_PER_MINUTE,
+    DEFAULT_AUTH_REQUESTS_PER_MINUTE,
+    DEFAULT_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+    DEFAULT_READ_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKEN_REFRESH_PERCENT,
+    DEFAULT_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_WRITE_REQUESTS_PER_MINUTE,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import AirCloudHomeDataUpdateCoordinator, AirCloudHomePollScheduler, AirCloudHomeSnapshotStore
+from .data import DOMAIN_DATA, AirCloudHomeData, AirCloudHomeDomainData
+from .service_actions import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceEntry
 
     from .data import AirCloudHomeConfigEntry
 
@@ -43,6 +61,11 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """
     Set up the integration.
 
+    Creates the poll scheduler shared by all config entries, which spreads
+    their polls evenly over the update interval instead of letting entries
+    set up together poll in lockstep, and the rate limiter every API client
+    sends its requests through.
+
     Args:
         hass: The Home Assistant instance.
         config: The Home Assistant configuration.
@@ -50,6 +73,11 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     Returns:
         True if setup was successful.
     """
+    hass.data[DOMAIN_DATA] = AirCloudHomeDomainData(
+        rate_limiter=AirCloudHomeRateLimiter(),
+        scheduler=AirCloudHomePollScheduler(),
+    )
+    await async_setup_services(hass)
     return True
 
 
@@ -61,11 +89,18 @@ async def async_setup_entry(
     Set up this integration using UI.
 
     This is called when a config entry is loaded. It:
-    1. Creates the API client with credentials from the config entry
-    2. Initializes the DataUpdateCoordinator for data fetching
-    3. Performs the first data refresh
-    4. Sets up the climate platform
-    5. Sets up reload listener for config changes
+    1. Creates the API client with credentials from the config entry,
+       sending requests through the integration's rate limiter
+    2. Restores persisted tokens so no sign-in is needed when they are valid,
+       and schedules background token refreshes
+    3. Initializes the DataUpdateCoordinator for data fetching, with a phase
+       of the integration's poll scheduler
+    4. Restores the last stored snapshot, or performs the first data refresh
+       if there is none
+    5. Sets up the climate platform
+    6. Starts the first live refresh in the background if the snapshot was
+       restored, and persists every successful refresh
+    7. Sets up reload listener for config changes
 
     Data flow in this integration:
     1. User enters username/password in config flow (config_flow.py)
@@ -84,19 +119,58 @@ async def async_setup_entry(
     For more information:
     https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
     """
+    # Every client shares one request budget; the lowest limits of any entry apply
+    domain_data = hass.data[DOMAIN_DATA]
+    entry.async_on_unload(
+        domain_data.rate_limiter.register(
+            entry.entry_id,
+            {
+                RequestKind.READ: entry.options.get(CONF_READ_REQUESTS_PER_MINUTE, DEFAULT_READ_REQUESTS_PER_MINUTE),
+                RequestKind.WRITE: entry.options.get(CONF_WRITE_REQUESTS_PER_MINUTE, DEFAULT_WRITE_REQUESTS_PER_MINUTE),
+                RequestKind.AUTH: entry.options.get(CONF_AUTH_REQUESTS_PER_MINUTE, DEFAULT_AUTH_REQUESTS_PER_MINUTE),
+            },
+        )
+    )
+
     # Initialize client first
     client = AirCloudHomeApiClient(
         email=entry.data[CONF_USERNAME],  # From config flow setup
         password=entry.data[CONF_PASSWORD],  # From config flow setup
         session=async_get_clientsession(hass),
+        family_groups_cache_ttl=timedelta(
+            minutes=entry.options.get(
+                CONF_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+                DEFAULT_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+            ),
+        ),
+        rate_limiter=domain_data.rate_limiter,
     )
 
+    # Reuse tokens from the previous run; sign-in is only the last fallback
+    token_store = AirCloudHomeTokenStore(hass, entry.entry_id)
+    await token_store.async_restore(client)
+    entry.async_on_unload(token_store.async_track(client))
+
+    # Refresh the access token in the background so commands never wait on it
+    refresh_scheduler = AirCloudHomeTokenRefreshScheduler(
+        hass,
+        entry,
+        client,
+        fraction=entry.options.get(CONF_TOKEN_REFRESH_PERCENT, DEFAULT_TOKEN_REFRESH_PERCENT) / 100,
+    )
+    refresh_scheduler.async_start()
+    entry.async_on_unload(refresh_scheduler.async_stop)
+
     # Get update interval from options, fallback to default (5 minutes)
     update_interval_minutes = entry.options.get(
         CONF_UPDATE_INTERVAL_MINUTES,
         DEFAULT_UPDATE_INTERVAL_MINUTES,
     )
 
+    # Offset this entry's polls from those of the other entries
+    scheduler = domain_data.scheduler
+    entry.async_on_unload(scheduler.async_register(entry.entry_id))
+
     # Initialize coordinator with config_entry
     coordinator = AirCloudHomeDataUpdateCoordinator(
         hass=hass,
@@ -104,6 +178,7 @@ async def async_setup_entry(
         name=DOMAIN,
         config_entry=entry,
         update_interval=timedelta(minutes=update_interval_minutes),
+        scheduler=scheduler,
         always_update=False,  # Only update entities when data actually changes
     )
 
@@ -114,10 +189,19 @@ async def async_setup_entry(
         coordinator=coordinator,
     )
 
+    # Create entities from the last stored snapshot without waiting for the
+    # cloud; only a first start has to block on a live refresh.
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    snapshot_store = AirCloudHomeSnapshotStore(hass, entry.entry_id)
+    if (snapshot := await snapshot_store.async_load()) is not None:
+        coordinator.async_restore(snapshot)
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(snapshot_store.async_track(coordinator))
+    if snapshot is not None:
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN} first refresh")
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -148,6 +232,51 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_config_entry_device(
+    hass: HomeAssistant,
+    entry: AirCloudHomeConfigEntry,
+    device_entry: DeviceEntry,
+) -> bool:
+    """
+    Allow deleting a device that is no longer listed in the account.
+
+    Devices removed while Home Assistant was running are cleaned up by the
+    coordinator; this covers those removed while it was not.
+
+    Args:
+        hass: The Home Assistant instance.
+        entry: The config entry the device belongs to.
+        device_entry: The device the user wants to delete.
+
+    Returns:
+        True if the device may be deleted.
+    """
+    coordinator = entry.runtime_data.coordinator
+    for domain, identifier in device_entry.identifiers:
+        device_id = identifier.removeprefix(f"{entry.entry_id}_")
+        if domain == DOMAIN and device_id.isdigit() and coordinator.get_device(int(device_id)) is not None:
+            return False
+    return True
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: AirCloudHomeConfigEntry,
+) -> None:
+    """
+    Clean up persisted data when a config entry is removed.
+
+    Args:
+        hass: The Home Assistant instance.
+        entry: The config entry being removed.
+
+    For more information:
+    https://developers.home-assistant.io/docs/config_entries_index/#removal-of-entries
+    """
+    await AirCloudHomeTokenStore(hass, entry.entry_id).async_remove()
+    await AirCloudHomeSnapshotStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: AirCloudHomeConfigEntry,
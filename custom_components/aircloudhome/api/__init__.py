@@ -9,24 +9,47 @@
 Exception hierarchy:
     AirCloudHomeApiClientError (base)
     ├── AirCloudHomeApiClientCommunicationError (network/timeout)
-    └── AirCloudHomeApiClientAuthenticationError (401/403)
+    │   └── AirCloudHomeApiClientCircuitOpenError (failing fast, API down)
+    ├── AirCloudHomeApiClientAuthenticationError (401/403)
+    └── AirCloudHomeApiClientFamilyAccessError (403/404 on a family group)
+
+Circuit breaker:
+    After repeated communication failures the client stops sending requests
+    and raises ApiClientCircuitOpenError until a cool-down has passed; a
+    single probe request then decides whether requests resume.
+
+Rate limiter:
+    One limiter, shared by every client of the integration, budgets reads,
+    writes and authentication requests per minute with separate token
+    buckets. Requests wait for a token of their own kind only.
 
 Coordinator exception mapping:
     ApiClientAuthenticationError → ConfigEntryAuthFailed (triggers reauth)
+    ApiClientCircuitOpenError   → UpdateFailed (retry_after = cool-down left)
     ApiClientCommunicationError → UpdateFailed (auto-retry)
     ApiClientError             → UpdateFailed (auto-retry)
 """
 
+from .circuit_breaker import AirCloudHomeCircuitBreaker, CircuitState
 from .client import (
     AirCloudHomeApiClient,
     AirCloudHomeApiClientAuthenticationError,
+    AirCloudHomeApiClientCircuitOpenError,
     AirCloudHomeApiClientCommunicationError,
     AirCloudHomeApiClientError,
+    AirCloudHomeApiClientFamilyAccessError,
 )
+from .rate_limiter import AirCloudHomeRateLimiter, RequestKind
 
 __all__ = [
     "AirCloudHomeApiClient",
     "AirCloudHomeApiClientAuthenticationError",
+    "AirCloudHomeApiClientCircuitOpenError",
     "AirCloudHomeApiClientCommunicationError",
     "AirCloudHomeApiClientError",
+    "AirCloudHomeApiClientFamilyAccessError",
+    "AirCloudHomeCircuitBreaker",
+    "AirCloudHomeRateLimiter",
+    "CircuitState",
+    "RequestKind",
 ]
@@ -0,0 +1,123 @@
+"""
+Circuit breaker for the AirCloud Home API.
+
+When the vendor cloud is down, every request would otherwise wait out the
+full request timeout. The breaker counts consecutive communication failures
+and, once a threshold is reached, makes the client fail fast locally until a
+cool-down has passed. A single probe request then decides whether the
+circuit closes again or stays open for another cool-down.
+
+States:
+    CLOSED     requests pass through; failures are counted
+    OPEN       requests are rejected locally until the cool-down ends
+    HALF_OPEN  one probe request is in flight; others are rejected
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive communication failures after which the circuit opens
+DEFAULT_FAILURE_THRESHOLD = 5
+# Seconds the circuit stays open before a probe request is let through
+DEFAULT_COOL_DOWN = 60.0
+# A probe that has not reported back within this many seconds (e.g. because
+# its caller was cancelled) no longer blocks the next probe
+_PROBE_TIMEOUT = 30.0
+
+
+class CircuitState(StrEnum):
+    """State of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class AirCloudHomeCircuitBreaker:
+    """
+    Track API health and decide whether requests may be sent.
+
+    The API client asks ``allow_request`` before every request and reports
+    the outcome with ``record_success`` or ``record_failure``. Any response
+    from the server (even an error status below 500) counts as a success,
+    since it proves the cloud is reachable.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cool_down: float = DEFAULT_COOL_DOWN,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures after which the circuit opens.
+            cool_down: Seconds to fail fast before probing the API again.
+        """
+        self._failure_threshold = max(failure_threshold, 1)
+        self._cool_down = cool_down
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit."""
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds until the next probe may be sent (0 if closed)."""
+        if self._state is CircuitState.CLOSED:
+            return 0.0
+        if self._state is CircuitState.HALF_OPEN:
+            return max(self._probe_started_at + _PROBE_TIMEOUT - time.monotonic(), 1.0)
+        return max(self._opened_at + self._cool_down - time.monotonic(), 1.0)
+
+    def allow_request(self) -> bool:
+        """
+        Return whether a request may be sent now.
+
+        After the cool-down, the first caller is let through as the probe
+        and the circuit becomes half-open.
+        """
+        if self._state is CircuitState.CLOSED:
+            return True
+        now = time.monotonic()
+        if self._state is CircuitState.OPEN and now < self._opened_at + self._cool_down:
+            return False
+        if self._state is CircuitState.HALF_OPEN and now < self._probe_started_at + _PROBE_TIMEOUT:
+            return False
+        _LOGGER.debug("Circuit half-open, probing the AirCloud Home API")
+        self._state = CircuitState.HALF_OPEN
+        self._probe_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Record that the API answered; closes the circuit."""
+        if self._state is not CircuitState.CLOSED:
+            _LOGGER.info("AirCloud Home API is reachable again, closing circuit")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a communication failure; may open the circuit."""
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN or (
+            self._state is CircuitState.CLOSED and self._failures >= self._failure_threshold
+        ):
+            if self._state is CircuitState.CLOSED:
+                _LOGGER.warning(
+                    "AirCloud Home API failed %d times in a row, pausing requests for %.0f s",
+                    self._failures,
+                    self._cool_down,
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Mapping
 from datetime import UTC, datetime, timedelta
 import logging
 import socket
@@ -18,8 +19,14 @@
 
 import aiohttp
 
+from .circuit_breaker import AirCloudHomeCircuitBreaker
+from .rate_limiter import AirCloudHomeRateLimiter, RequestKind
+
 _LOGGER = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying an idempotent request for
+_TRANSIENT_HTTP_STATUSES = frozenset({408, 429})
+
 # Refresh tokens this many seconds before their stated expiry to account for
 # clock skew and network latency.
 _EXPIRY_BUFFER = timedelta(seconds=60)
@@ -32,7 +39,19 @@ class AirCloudHomeApiClientError(Exception):
 class AirCloudHomeApiClientCommunicationError(
     AirCloudHomeApiClientError,
 ):
-    """Exception to indicate a communication error with the API."""
+    """
+    Exception to indicate a communication error with the API.
+
+    Attributes:
+        retryable: Whether repeating the request may succeed. Only set for
+            idempotent (GET) requests that failed transiently: timeouts,
+            connection errors, HTTP 408/429 and 5xx responses.
+    """
+
+    def __init__(self, msg: str, *, retryable: bool = False) -> None:
+        """Initialize the exception."""
+        super().__init__(msg)
+        self.retryable = retryable
 
 
 class AirCloudHomeApiClientAuthenticationError(
@@ -41,7 +60,32 @@ class AirCloudHomeApiClientAuthenticationError(
     """Exception to indicate an authentication error with the API."""
 
 
-def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
+class AirCloudHomeApiClientFamilyAccessError(
+    AirCloudHomeApiClientError,
+):
+    """Exception to indicate a family group is no longer accessible (403/404)."""
+
+
+class AirCloudHomeApiClientCircuitOpenError(
+    AirCloudHomeApiClientCommunicationError,
+):
+    """
+    Exception to indicate a request was not sent because the API is failing.
+
+    Raised locally, without waiting for the request timeout, while the
+    circuit breaker is open.
+
+    Attributes:
+        retry_after: Seconds until the next probe request may be sent.
+    """
+
+    def __init__(self, msg: str, *, retry_after: float) -> None:
+        """Initialize the exception."""
+        super().__init__(msg)
+        self.retry_after = retry_after
+
+
+def _verify_response_or_raise(response: aiohttp.ClientResponse, family_id: int | None = None) -> None:
     """
     Verify that the API response is valid.
 
@@ -49,12 +93,22 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
 
     Args:
         response: The aiohttp ClientResponse to verify.
+        family_id: The family group the request was scoped to, if any. For
+            family-scoped requests a 403/404 means the group itself is gone or
+            no longer shared with the user, not that the credentials are bad.
 
     Raises:
+        AirCloudHomeApiClientFamilyAccessError: For 403/404 errors on a
+            family-scoped request.
         AirCloudHomeApiClientAuthenticationError: For 401/403 errors.
         aiohttp.ClientResponseError: For other HTTP errors.
 
     """
+    if family_id is not None and response.status in (403, 404):
+        msg = f"Family group {family_id} is not accessible (HTTP {response.status})"
+        raise AirCloudHomeApiClientFamilyAccessError(
+            msg,
+        )
     if response.status in (401, 403):
         msg = "Invalid credentials"
         raise AirCloudHomeApiClientAuthenticationError(
@@ -63,6 +117,16 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+def _isoformat_or_none(value: datetime | None) -> str | None:
+    """Return ``value`` as an ISO 8601 string, or ``None``."""
+    return value.isoformat() if value is not None else None
+
+
+def _datetime_or_none(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 string produced by ``_isoformat_or_none``."""
+    return datetime.fromisoformat(value) if value is not None else None
+
+
 class AirCloudHomeApiClient:
     """
     API Client for AirCloud Home AC integration.
@@ -81,8 +145,18 @@ class AirCloudHomeApiClient:
         _refresh_token: The refresh token for obtaining new access tokens.
         _access_token_expires_at: UTC datetime when the access token expires
             (``None`` if expiry is unknown).
+        _access_token_issued_at: UTC datetime when the access token was
+            obtained (``None`` if unknown, e.g. restored from older storage).
         _refresh_token_expires_at: UTC datetime when the refresh token expires
             (``None`` if expiry is unknown).
+        _family_groups_cache: The last family group list, or ``None`` if
+            nothing is cached.
+        _family_groups_cache_time: UTC datetime the cached list was fetched.
+        _family_groups_cache_ttl: How long the cached list stays fresh
+            (``None`` disables caching).
+        _circuit_breaker: Makes requests fail fast while the API is down.
+        _rate_limiter: The integration-wide request budget, or ``None`` to
+            send requests without limits.
 
     """
 
@@ -93,6 +167,10 @@ def __init__(
         email: str,
         password: str,
         session: aiohttp.ClientSession,
+        family_groups_cache_ttl: timedelta | None = None,
+        circuit_breaker: AirCloudHomeCircuitBreaker | None = None,
+        *,
+        rate_limiter: AirCloudHomeRateLimiter | None = None,
     ) -> None:
         """
         Initialize the API Client with credentials.
@@ -101,6 +179,12 @@ def __init__(
             email: The email for authentication from config flow.
             password: The password for authentication from config flow.
             session: The aiohttp ClientSession to use for requests.
+            family_groups_cache_ttl: How long a family group list may be reused
+                before it is fetched again. ``None`` or zero disables caching.
+            circuit_breaker: The circuit breaker guarding requests. A breaker
+                with default thresholds is created if omitted.
+            rate_limiter: The rate limiter shared by all clients of the
+                integration. Requests are not limited if omitted.
 
         """
         self._email = email
@@ -109,8 +193,15 @@ def __init__(
         self._access_token: str | None = None
         self._refresh_token: str | None = None
         self._access_token_expires_at: datetime | None = None
+        self._access_token_issued_at: datetime | None = None
         self._refresh_token_expires_at: datetime | None = None
         self._refresh_lock = asyncio.Lock()
+        self._family_groups_cache: list[dict[str, Any]] | None = None
+        self._family_groups_cache_time: datetime | None = None
+        self._family_groups_cache_ttl = family_groups_cache_ttl
+        self._token_listeners: list[Callable[[], None]] = []
+        self._circuit_breaker = circuit_breaker or AirCloudHomeCircuitBreaker()
+        self._rate_limiter = rate_limiter
 
     async def async_sign_in(self) -> dict[str, Any]:
         """
@@ -129,10 +220,14 @@ async def async_sign_in(self) -> dict[str, Any]:
             "email": self._email,
             "password": self._password,
         }
+        # Sign-in never triggers the 401 refresh path: a 401 here means the
+        # credentials themselves are wrong.
         response = await self._api_wrapper(
             method="post",
             url=f"{self._BASE_URL}/iam/auth/sign-in",
             data=data,
+            kind=RequestKind.AUTH,
+            _is_retry=True,
         )
         self._store_tokens(response)
         return response
@@ -165,15 +260,25 @@ async def async_refresh_token(self) -> dict[str, Any]:
                 "Authorization": f"Bearer {self._refresh_token}",
                 "isRefreshToken": "true",
             },
+            kind=RequestKind.AUTH,
             _is_retry=True,
         )
         self._store_tokens(response)
         return response
 
-    async def async_get_family_groups(self) -> list[dict[str, Any]]:
+    async def async_get_family_groups(self, *, use_cache: bool = True) -> list[dict[str, Any]]:
         """
         Get list of family groups for the authenticated user.
 
+        Family groups rarely change, so the list is cached for
+        ``family_groups_cache_ttl``. An empty or malformed list is not
+        cached. The cache is dropped by ``invalidate_family_groups_cache``
+        and whenever an idu-list request fails, so a family group that went
+        away is noticed on the next listing.
+
+        Args:
+            use_cache: Return the cached list if it is still fresh.
+
         Returns:
             A list of family groups with their details.
 
@@ -183,6 +288,9 @@ async def async_get_family_groups(self) -> list[dict[str, Any]]:
             AirCloudHomeApiClientError: For other API errors.
 
         """
+        if use_cache and self._is_family_groups_cache_valid():
+            return list(self._family_groups_cache or [])
+
         await self._async_ensure_valid_token()
 
         response = await self._api_wrapper(
@@ -190,12 +298,26 @@ async def async_get_family_groups(self) -> list[dict[str, Any]]:
             url=f"{self._BASE_URL}/iam/family-account/v2/groups",
             headers={"Authorization": f"Bearer {self._access_token}"},
         )
-        return response.get("result", [])
+        family_groups = response.get("result") if isinstance(response, dict) else None
+        if not isinstance(family_groups, list) or not family_groups:
+            # Rather a glitch than an account without family groups; ask again next time
+            self.invalidate_family_groups_cache()
+            return []
+        self._family_groups_cache = family_groups
+        self._family_groups_cache_time = datetime.now(UTC)
+        return list(family_groups)
+
+    def invalidate_family_groups_cache(self) -> None:
+        """Drop the cached family group list so the next call re-lists groups."""
+        self._family_groups_cache = None
+        self._family_groups_cache_time = None
 
     async def async_get_idu_list(self, family_id: int) -> list[dict[str, Any]]:
         """
         Get list of indoor units (IDU) for a family group.
 
+        The family group cache is invalidated if the request fails.
+
         Args:
             family_id: The family group ID.
 
@@ -203,6 +325,8 @@ async def async_get_idu_list(self, family_id: int) -> list[dict[str, Any]]:
             A list of indoor units with their current state.
 
         Raises:
+            AirCloudHomeApiClientFamilyAccessError: If the family group no
+                longer exists or is no longer shared with the user.
             AirCloudHomeApiClientAuthenticationError: If authentication fails.
             AirCloudHomeApiClientCommunicationError: If communication fails.
             AirCloudHomeApiClientError: For other API errors.
@@ -210,11 +334,16 @@ async def async_get_idu_list(self, family_id: int) -> list[dict[str, Any]]:
         """
         await self._async_ensure_valid_token()
 
-        response = await self._api_wrapper(
-            method="get",
-            url=f"{self._BASE_URL}/rac/ownership/groups/{family_id}/idu-list",
-            headers={"Authorization": f"Bearer {self._access_token}"},
-        )
+        try:
+            response = await self._api_wrapper(
+                method="get",
+                url=f"{self._BASE_URL}/rac/ownership/groups/{family_id}/idu-list",
+                headers={"Authorization": f"Bearer {self._access_token}"},
+                family_id=family_id,
+            )
+        except AirCloudHomeApiClientError:
+            self.invalidate_family_groups_cache()
+            raise
         return response if isinstance(response, list) else []
 
     async def async_control_device(
@@ -279,6 +408,9 @@ async def _api_wrapper(
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        family_id: int | None = None,
+        *,
+        kind: RequestKind | None = None,
         _is_retry: bool = False,
     ) -> Any:
         """
@@ -294,6 +426,10 @@ async def _api_wrapper(
             url: The URL to request.
             data: Optional data to send in the request body.
             headers: Optional headers to include in the request.
+            family_id: The family group a family-scoped request targets, so
+                403/404 responses are reported as a family access error.
+            kind: The rate limiter budget the request draws from. Defaults to
+                ``READ`` for GET requests and ``WRITE`` otherwise.
             _is_retry: Internal flag – set to ``True`` when this call is
                 already a retry after token refresh, preventing infinite loops.
 
@@ -303,12 +439,32 @@ async def _api_wrapper(
         Raises:
             AirCloudHomeApiClientAuthenticationError: If authentication fails
                 and cannot be resolved by refreshing the token.
-            AirCloudHomeApiClientCommunicationError: If communication fails.
+            AirCloudHomeApiClientCircuitOpenError: If the request was not sent
+                because the circuit breaker is open.
+            AirCloudHomeApiClientCommunicationError: If communication fails,
+                or the rate limiter held the request for the whole request
+                timeout. ``retryable`` is set for transient failures of GET
+                requests.
             AirCloudHomeApiClientError: For other API errors.
 
         """
+        if not self._circuit_breaker.allow_request():
+            msg = "AirCloud Home API is unavailable, not sending request"
+            raise AirCloudHomeApiClientCircuitOpenError(
+                msg,
+                retry_after=self._circuit_breaker.retry_after,
+            )
+
+        idempotent = method.lower() == "get"
+        sent = False
         try:
             async with asyncio.timeout(10):
+                if self._rate_limiter is not None:
+                    # Waiting for a token counts against the request timeout
+                    await self._rate_limiter.async_acquire(
+                        kind or (RequestKind.READ if idempotent else RequestKind.WRITE)
+                    )
+                sent = True
                 _LOGGER.debug("API %s %s body=%s", method.upper(), url, data)
                 response = await self._session.request(
                     method=method,
@@ -316,14 +472,20 @@ async def _api_wrapper(
                     headers=headers,
                     json=data,
                 )
+                if response.status < 500:
+                    self._circuit_breaker.record_success()
                 needs_refresh = response.status == 401 and not _is_retry
                 if not needs_refresh:
                     if response.status >= 400:
                         error_body = await response.text()
                         _LOGGER.error("API error %s from %s: %s", response.status, url, error_body)
-                    _verify_response_or_raise(response)
+                    _verify_response_or_raise(response, family_id)
                     return await response.json()
 
+            # The server rejected the token even though it had not expired
+            # locally (e.g. it was restored from storage and revoked since), so
+            # make sure it is not reused.
+            self._discard_access_token(headers)
             # Perform token refresh outside the request timeout so that the
             # refresh request gets its own independent 10-second window.
             await self._async_ensure_valid_token()
@@ -335,20 +497,38 @@ async def _api_wrapper(
                 url=url,
                 data=data,
                 headers=refreshed_headers,
+                family_id=family_id,
+                kind=kind,
                 _is_retry=True,
             )
 
         except AirCloudHomeApiClientError:
             raise
         except TimeoutError as exception:
+            if not sent:
+                msg = "Timeout waiting for the request rate limit"
+                raise AirCloudHomeApiClientCommunicationError(msg, retryable=idempotent) from exception
+            self._circuit_breaker.record_failure()
             msg = f"Timeout error fetching information - {exception}"
             raise AirCloudHomeApiClientCommunicationError(
                 msg,
+                retryable=idempotent,
+            ) from exception
+        except aiohttp.ClientResponseError as exception:
+            msg = f"Error fetching information - {exception}"
+            if exception.status >= 500:
+                self._circuit_breaker.record_failure()
+            transient = exception.status >= 500 or exception.status in _TRANSIENT_HTTP_STATUSES
+            raise AirCloudHomeApiClientCommunicationError(
+                msg,
+                retryable=idempotent and transient,
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self._circuit_breaker.record_failure()
             msg = f"Error fetching information - {exception}"
             raise AirCloudHomeApiClientCommunicationError(
                 msg,
+                retryable=idempotent,
             ) from exception
         except Exception as exception:
             msg = f"Something really wrong happened! - {exception}"
@@ -356,6 +536,82 @@ async def _api_wrapper(
                 msg,
             ) from exception
 
+    def add_token_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """
+        Register a callback invoked whenever new tokens are stored.
+
+        Args:
+            listener: Called without arguments after sign-in or token refresh.
+
+        Returns:
+            A function that removes the listener again.
+
+        """
+        self._token_listeners.append(listener)
+
+        def remove_listener() -> None:
+            if listener in self._token_listeners:
+                self._token_listeners.remove(listener)
+
+        return remove_listener
+
+    def export_tokens(self) -> dict[str, Any]:
+        """
+        Return the current tokens and expiries in a JSON-serialisable form.
+
+        The email is included so tokens are never restored into a client that
+        was configured for a different account.
+
+        """
+        return {
+            "email": self._email,
+            "access_token": self._access_token,
+            "refresh_token": self._refresh_token,
+            "access_token_expires_at": _isoformat_or_none(self._access_token_expires_at),
+            "access_token_issued_at": _isoformat_or_none(self._access_token_issued_at),
+            "refresh_token_expires_at": _isoformat_or_none(self._refresh_token_expires_at),
+        }
+
+    def restore_tokens(self, data: Mapping[str, Any]) -> bool:
+        """
+        Restore tokens previously returned by ``export_tokens``.
+
+        Restored tokens go through the normal expiry checks, so an expired
+        access token is refreshed and a sign-in only happens when the refresh
+        token is unusable too.
+
+        Args:
+            data: The stored token data.
+
+        Returns:
+            ``True`` if tokens were restored, ``False`` if the data belongs to
+            another account or is malformed.
+
+        """
+        if str(data.get("email", "")).casefold() != self._email.casefold():
+            return False
+        try:
+            access_expires_at = _datetime_or_none(data.get("access_token_expires_at"))
+            access_issued_at = _datetime_or_none(data.get("access_token_issued_at"))
+            refresh_expires_at = _datetime_or_none(data.get("refresh_token_expires_at"))
+        except (TypeError, ValueError):
+            _LOGGER.debug("Ignoring stored tokens with invalid expiry")
+            return False
+
+        self._access_token = data.get("access_token")
+        self._refresh_token = data.get("refresh_token")
+        self._access_token_expires_at = access_expires_at
+        self._access_token_issued_at = access_issued_at
+        self._refresh_token_expires_at = refresh_expires_at
+        return bool(self._access_token or self._refresh_token)
+
+    def _discard_access_token(self, headers: Mapping[str, str] | None) -> None:
+        """Forget the access token if it is the one sent in ``headers``."""
+        if self._access_token and (headers or {}).get("Authorization") == f"Bearer {self._access_token}":
+            self._access_token = None
+            self._access_token_expires_at = None
+            self._access_token_issued_at = None
+
     def _store_tokens(self, response: dict[str, Any]) -> None:
         """
         Persist tokens and their expiry datetimes from an API response.
@@ -378,6 +634,7 @@ def _store_tokens(self, response: dict[str, Any]) -> None:
         now = datetime.now(UTC)
         if token := response.get("token"):
             self._access_token = token
+            self._access_token_issued_at = now
             if (expires_ms := response.get("access_token_expires_in")) is not None:
                 self._access_token_expires_at = now + timedelta(milliseconds=expires_ms)
             else:
@@ -390,6 +647,61 @@ def _store_tokens(self, response: dict[str, Any]) -> None:
             # If the response does not include a new refresh token expiry, keep
             # the previously stored value unchanged.
 
+        for listener in list(self._token_listeners):
+            listener()
+
+    def _is_family_groups_cache_valid(self) -> bool:
+        """Return ``True`` when a cached family group list exists and is within its TTL."""
+        if self._family_groups_cache is None or self._family_groups_cache_time is None:
+            return False
+        if not self._family_groups_cache_ttl:
+            return False
+        return datetime.now(UTC) < self._family_groups_cache_time + self._family_groups_cache_ttl
+
+    def access_token_refresh_at(self, fraction: float) -> datetime | None:
+        """
+        Return when the access token should be refreshed proactively.
+
+        Args:
+            fraction: Share of the token lifetime (0-1) after which it should
+                be refreshed.
+
+        Returns:
+            The UTC datetime to refresh at, or ``None`` when there is no token
+            or its expiry is unknown. If the issue time is unknown the token
+            is refreshed just before the regular expiry buffer.
+
+        """
+        if not self._access_token or self._access_token_expires_at is None:
+            return None
+        if self._access_token_issued_at is None:
+            return self._access_token_expires_at - 2 * _EXPIRY_BUFFER
+        lifetime = self._access_token_expires_at - self._access_token_issued_at
+        return self._access_token_issued_at + lifetime * fraction
+
+    async def async_refresh_proactively(self, fraction: float) -> None:
+        """
+        Refresh the access token ahead of its expiry.
+
+        Meant for a background scheduler so that user commands and polls
+        never pay for token maintenance. Shares ``_refresh_lock`` with
+        ``_async_ensure_valid_token``; if another caller renewed the token
+        while this one waited, nothing is sent.
+
+        Args:
+            fraction: Share of the token lifetime (0-1) after which it is due.
+
+        Raises:
+            AirCloudHomeApiClientAuthenticationError: If sign-in fails.
+            AirCloudHomeApiClientCommunicationError: If communication fails.
+
+        """
+        async with self._refresh_lock:
+            refresh_at = self.access_token_refresh_at(fraction)
+            if refresh_at is not None and datetime.now(UTC) < refresh_at:
+                return
+            await self._async_renew_tokens()
+
     def _is_access_token_valid(self) -> bool:
         """
         Return ``True`` when the access token exists and has not yet expired.
@@ -435,7 +747,8 @@ async def _async_ensure_valid_token(self) -> None:
 
         1. Access token is still valid → do nothing.
         2. Access token expired / missing, refresh token valid → refresh.
-        3. Both tokens expired / missing → full sign-in with credentials.
+        3. Both tokens expired / missing, or the refresh token was rejected
+           → full sign-in with credentials (last resort).
 
         Raises:
             AirCloudHomeApiClientAuthenticationError: If sign-in fails.
@@ -451,7 +764,24 @@ async def _async_ensure_valid_token(self) -> None:
             if self._is_access_token_valid():
                 return
 
-            if self._is_refresh_token_valid():
+            await self._async_renew_tokens()
+
+    async def _async_renew_tokens(self) -> None:
+        """
+        Obtain a new access token, preferring the refresh token.
+
+        Must be called with ``_refresh_lock`` held. Falls back to a full
+        sign-in only when the refresh token is missing, expired or rejected.
+
+        """
+        if self._is_refresh_token_valid():
+            try:
                 await self.async_refresh_token()
+            except AirCloudHomeApiClientAuthenticationError:
+                _LOGGER.debug("Refresh token rejected, signing in again")
+                self._refresh_token = None
+                self._refresh_token_expires_at = None
             else:
-                await self.async_sign_in()
+                return
+
+        await self.async_sign_in()
@@ -0,0 +1,182 @@
+"""
+Rate limiter for the AirCloud Home API.
+
+Every config entry has its own API client, but the vendor throttles the
+cloud as a whole: several accounts polling while automations send bulk
+commands trip its limits and fail together. One limiter is shared by every
+client of the integration. It holds a token bucket per request kind, so
+reads, writes and authentication requests are budgeted separately, and a
+request waits for a token instead of being sent. Limits are opt-in; without
+any, requests are never held back.
+
+Waiting requests of one kind are served in arrival order. Kinds never wait
+on each other: polls cannot use up the budget of commands, and a command is
+sent as soon as the write bucket has a token, however many reads are waiting.
+
+Buckets:
+    READ   GET requests (family groups, idu-lists)
+    WRITE  control commands
+    AUTH   sign-in and token refresh
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Mapping
+from enum import StrEnum
+import logging
+import math
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# A bucket holds this many seconds' worth of requests, so a burst (e.g. all
+# idu-lists of a refresh) goes out at once while the per-minute rate holds
+_BURST_SECONDS = 10.0
+
+
+class RequestKind(StrEnum):
+    """Kind of API request, each with its own budget."""
+
+    READ = "read"
+    WRITE = "write"
+    AUTH = "auth"
+
+
+class _TokenBucket:
+    """Allow ``rate`` requests per minute with bursts of ``_BURST_SECONDS``."""
+
+    def __init__(self) -> None:
+        """Initialize an unlimited bucket."""
+        self._rate = 0.0
+        self._capacity = 0.0
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+
+    def set_rate(self, per_minute: float) -> None:
+        """Change the rate; 0 or less removes the limit. A newly limited bucket starts full."""
+        self._refill()
+        was_limited = bool(self._rate)
+        self._rate = max(per_minute, 0.0) / 60
+        self._capacity = max(math.ceil(self._rate * _BURST_SECONDS), 1) if self._rate else 0.0
+        self._tokens = min(self._tokens, self._capacity) if was_limited else self._capacity
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self._tokens + (now - self._updated_at) * self._rate, self._capacity)
+        self._updated_at = now
+
+    def try_take(self) -> bool:
+        """Take a token if one is available; an unlimited bucket always has one."""
+        if not self._rate:
+            return True
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def put_back(self) -> None:
+        """Return a token that was taken but not used."""
+        if self._rate:
+            self._tokens = min(self._tokens + 1, self._capacity)
+
+    def seconds_until_token(self) -> float:
+        """Return how long until a token is available."""
+        if not self._rate:
+            return 0.0
+        self._refill()
+        return max(1 - self._tokens, 0.0) / self._rate
+
+
+class AirCloudHomeRateLimiter:
+    """
+    Budget requests of every API client of the integration.
+
+    Each config entry registers the limits from its options; the lowest limit
+    any registered entry configured applies per request kind, and 0 means no
+    limit. The API client calls ``async_acquire`` before every request, within
+    the request's timeout.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the rate limiter without any limits."""
+        self._buckets = {kind: _TokenBucket() for kind in RequestKind}
+        self._limits: dict[str, Mapping[RequestKind, float]] = {}
+        # Requests waiting for a token, in arrival order
+        self._waiters: list[tuple[RequestKind, asyncio.Future[None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    def register(self, entry_id: str, limits: Mapping[RequestKind, float]) -> Callable[[], None]:
+        """
+        Apply a config entry's limits.
+
+        Args:
+            entry_id: The config entry the limits come from.
+            limits: Requests per minute by kind; 0 or a missing kind means no limit.
+
+        Returns:
+            A function that withdraws the entry's limits.
+        """
+        self._limits[entry_id] = limits
+        self._apply_limits()
+
+        def unregister() -> None:
+            self._limits.pop(entry_id, None)
+            self._apply_limits()
+
+        return unregister
+
+    def _apply_limits(self) -> None:
+        """Set every bucket to the lowest limit any entry configured."""
+        for kind, bucket in self._buckets.items():
+            rates = [rate for limits in self._limits.values() if (rate := limits.get(kind, 0)) > 0]
+            bucket.set_rate(min(rates, default=0))
+        if self._waiters:
+            self._dispatch()
+
+    async def async_acquire(self, kind: RequestKind) -> None:
+        """
+        Wait until a request of the given kind may be sent.
+
+        Callers bound the wait with their request timeout; a cancelled wait
+        leaves the queue without using a token.
+
+        Args:
+            kind: The kind of request about to be sent.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((kind, future))
+        self._dispatch()
+        if future.done():
+            return
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The token was granted just as the wait was cancelled
+                self._buckets[kind].put_back()
+            raise
+        _LOGGER.debug("Rate limited %s request for %.1f s", kind, time.monotonic() - started)
+
+    def _dispatch(self) -> None:
+        """Hand out tokens to waiting requests, and wake up again when the next one is due."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        waiting = []
+        delay = math.inf
+        for kind, future in self._waiters:
+            if future.done():
+                continue
+            bucket = self._buckets[kind]
+            if bucket.try_take():
+                future.set_result(None)
+            else:
+                waiting.append((kind, future))
+                delay = min(delay, bucket.seconds_until_token())
+        self._waiters = waiting
+        if waiting:
+            self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
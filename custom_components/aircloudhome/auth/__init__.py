@@ -0,0 +1,17 @@
+"""
+Authentication lifecycle package for aircloudhome.
+
+The API client keeps tokens in memory only and knows nothing about Home
+Assistant. This package owns the Home Assistant side of the token lifecycle.
+
+Package structure:
+- token_store.py: Persist tokens across restarts and reloads (HA Store)
+- refresh_scheduler.py: Refresh the access token in the background before it expires
+"""
+
+from __future__ import annotations
+
+from .refresh_scheduler import AirCloudHomeTokenRefreshScheduler
+from .token_store import AirCloudHomeTokenStore
+
+__all__ = ["AirCloudHomeTokenRefreshScheduler", "AirCloudHomeTokenStore"]
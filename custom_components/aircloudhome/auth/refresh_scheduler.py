@@ -0,0 +1,123 @@
+"""
+Proactive access token refresh for aircloudhome.
+
+Without this, a token is only renewed when a request finds it expired or
+receives a 401, which puts the refresh round-trip (and sometimes a wasted
+401 round-trip) on the latency of whichever poll or climate command hits it
+first. The scheduler renews the token in the background once a configurable
+share of its lifetime has passed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from custom_components.aircloudhome.api import (
+    AirCloudHomeApiClientAuthenticationError,
+    AirCloudHomeApiClientCommunicationError,
+)
+from custom_components.aircloudhome.const import LOGGER, TOKEN_REFRESH_RETRY_DELAY
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+import homeassistant.util.dt as dt_util
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.api import AirCloudHomeApiClient
+    from custom_components.aircloudhome.data import AirCloudHomeConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+class AirCloudHomeTokenRefreshScheduler:
+    """
+    Refresh the access token at a fraction of its lifetime.
+
+    The refresh goes through ``AirCloudHomeApiClient.async_refresh_proactively``
+    and therefore the client's ``_refresh_lock``, so it never races a refresh
+    triggered by a request. The timer is rescheduled every time the client
+    stores new tokens, whoever obtained them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: AirCloudHomeConfigEntry,
+        client: AirCloudHomeApiClient,
+        fraction: float,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry: The config entry owning the client; background tasks are
+                bound to it so they are cancelled on unload.
+            client: The API client whose token should be kept fresh.
+            fraction: Share of the token lifetime (0-1) after which it is
+                refreshed.
+
+        """
+        self._hass = hass
+        self._entry = entry
+        self._client = client
+        self._fraction = fraction
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._unsub_tokens: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first refresh and follow future token changes."""
+        self._unsub_tokens = self._client.add_token_listener(self._async_schedule)
+        self._async_schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending refresh and stop following token changes."""
+        self._cancel_timer()
+        if self._unsub_tokens is not None:
+            self._unsub_tokens()
+            self._unsub_tokens = None
+
+    @callback
+    def _async_schedule(self, when: datetime | None = None) -> None:
+        """Schedule the next refresh, by default at the token's due time."""
+        self._cancel_timer()
+        if when is None and (when := self._client.access_token_refresh_at(self._fraction)) is None:
+            # No token yet (or no expiry): the next request signs in, and
+            # the token listener schedules us from there.
+            return
+        when = max(when, dt_util.utcnow())
+        LOGGER.debug("Next proactive token refresh at %s", when.isoformat())
+        self._unsub_timer = async_track_point_in_utc_time(self._hass, self._async_handle_timer, when)
+
+    @callback
+    def _async_handle_timer(self, _now: datetime) -> None:
+        """Run the refresh in a task bound to the config entry."""
+        self._unsub_timer = None
+        self._entry.async_create_background_task(
+            self._hass,
+            self._async_refresh(),
+            f"{self._entry.domain} proactive token refresh",
+        )
+
+    async def _async_refresh(self) -> None:
+        """Refresh the token; on success the token listener reschedules."""
+        try:
+            await self._client.async_refresh_proactively(self._fraction)
+        except AirCloudHomeApiClientAuthenticationError as exception:
+            # Leave it to the next request, which surfaces reauth through the
+            # coordinator.
+            LOGGER.warning("Proactive token refresh failed - %s", exception)
+        except AirCloudHomeApiClientCommunicationError as exception:
+            LOGGER.debug("Proactive token refresh failed, retrying later - %s", exception)
+            self._async_schedule(dt_util.utcnow() + timedelta(seconds=TOKEN_REFRESH_RETRY_DELAY))
+        else:
+            if self._unsub_timer is None:
+                # Nothing was due (another caller already refreshed).
+                self._async_schedule()
+
+    def _cancel_timer(self) -> None:
+        """Cancel the pending timer, if any."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
@@ -0,0 +1,91 @@
+"""
+Token persistence for aircloudhome.
+
+Access and refresh tokens are saved in a Home Assistant ``Store`` keyed by
+config entry, so a restart or reload can reuse them instead of signing in
+with the stored password again. The vendor rate-limits sign-ins, and a
+sign-in adds a round-trip before the first poll.
+
+For more information on storage:
+https://developers.home-assistant.io/docs/api/storage
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from custom_components.aircloudhome.const import DOMAIN, LOGGER, TOKEN_SAVE_DELAY, TOKEN_STORAGE_VERSION
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from custom_components.aircloudhome.api import AirCloudHomeApiClient
+    from homeassistant.core import HomeAssistant
+
+
+class AirCloudHomeTokenStore:
+    """
+    Persist the API client's tokens for one config entry.
+
+    The store file is written with ``private=True`` because it holds bearer
+    tokens for the user's account.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """
+        Initialize the token store.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry the tokens belong to.
+
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            TOKEN_STORAGE_VERSION,
+            f"{DOMAIN}.tokens.{entry_id}",
+            private=True,
+            atomic_writes=True,
+        )
+
+    async def async_restore(self, client: AirCloudHomeApiClient) -> bool:
+        """
+        Load stored tokens into the API client.
+
+        Args:
+            client: The API client to restore tokens into.
+
+        Returns:
+            True if tokens were restored.
+
+        """
+        if (data := await self._store.async_load()) is None:
+            return False
+        restored = client.restore_tokens(data)
+        LOGGER.debug("Stored tokens %s", "restored" if restored else "ignored")
+        return restored
+
+    @callback
+    def async_track(self, client: AirCloudHomeApiClient) -> Callable[[], None]:
+        """
+        Save the client's tokens whenever they change.
+
+        Args:
+            client: The API client whose tokens should be persisted.
+
+        Returns:
+            A function that stops tracking, for ``entry.async_on_unload``.
+
+        """
+
+        @callback
+        def _async_schedule_save() -> None:
+            self._store.async_delay_save(client.export_tokens, TOKEN_SAVE_DELAY)
+
+        return client.add_token_listener(_async_schedule_save)
+
+    async def async_remove(self) -> None:
+        """Delete the stored tokens."""
+        await self._store.async_remove()
@@ -4,10 +4,12 @@
 
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
+
 from .air_conditioning import CLIMATE_ENTITY_DESCRIPTION, AirCloudHomeAirConditioner
 
 if TYPE_CHECKING:
-    from custom_components.aircloudhome.data import AirCloudHomeConfigEntry
+    from custom_components.aircloudhome.data import AirCloudHomeConfigEntry, AirCloudHomeDevice
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -17,16 +19,27 @@ async def async_setup_entry(
     entry: AirCloudHomeConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up the climate platform."""
+    """
+    Set up the climate platform.
+
+    Entities are created for the current devices right away, and later for
+    devices the coordinator finds on a refresh, without reloading the entry.
+    Each entity subscribes to its family group's coordinator. Devices the
+    device filter drops get no entity.
+    """
     coordinator = entry.runtime_data.coordinator
 
-    # Create climate entities for each AC device
-    devices = coordinator.data.get("devices", [])
-    async_add_entities(
-        AirCloudHomeAirConditioner(
-            coordinator=coordinator,
-            entity_description=CLIMATE_ENTITY_DESCRIPTION,
-            device=device,
+    @callback
+    def _async_add_devices(devices: list[AirCloudHomeDevice]) -> None:
+        """Create climate entities for AC devices."""
+        async_add_entities(
+            AirCloudHomeAirConditioner(
+                coordinator=coordinator.family_coordinators[device.family_id],
+                entity_description=CLIMATE_ENTITY_DESCRIPTION,
+                device=device,
+            )
+            for device in devices
+            if coordinator.device_filter.allows_device(device)
         )
-        for device in devices
-    )
+
+    entry.async_on_unload(coordinator.async_add_device_listener(_async_add_devices))
@@ -4,22 +4,22 @@
 
 from typing import Any
 
-from custom_components.aircloudhome.coordinator import AirCloudHomeDataUpdateCoordinator
+from custom_components.aircloudhome.coordinator import AirCloudHomeFamilyCoordinator
+from custom_components.aircloudhome.coordinator.data_processing import build_climate_view
+from custom_components.aircloudhome.data import AirCloudHomeDevice, OperationMode
 from custom_components.aircloudhome.entity import AirCloudHomeEntity
 from custom_components.aircloudhome.entity_utils.climate_mappings import (
     API_FAN_SPEED_TO_HA,
-    API_MODE_TO_HVAC_MODE,
     API_SWING_TO_HA,
     HA_FAN_SPEED_TO_API,
     HA_SWING_TO_API,
-    HUMIDITY_MODES,
     HVAC_MODE_TO_API_MODE,
     PRESET_DRY_COOL,
 )
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import PRESET_NONE, ClimateEntityFeature, HVACMode
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityDescription
 
 # Climate entity description for AC units
@@ -59,76 +59,77 @@ class AirCloudHomeAirConditioner(ClimateEntity, AirCloudHomeEntity):
 
     def __init__(
         self,
-        coordinator: AirCloudHomeDataUpdateCoordinator,
+        coordinator: AirCloudHomeFamilyCoordinator,
         entity_description: EntityDescription,
-        device: dict[str, Any],
+        device: AirCloudHomeDevice,
     ) -> None:
         """Initialize the climate entity."""
-        super().__init__(coordinator, entity_description, device_id=str(device["id"]))
+        super().__init__(coordinator, entity_description, device_id=str(device.id), context=device.id)
+        self._device_id = device.id
         self._device = device
-        self._supports_humidity = "humidity" in device
+        self._view = coordinator.get_climate_view(device.id) or build_climate_view(device)
+        self._device_listed = True
+        self._supports_humidity = device.has_humidity
         if self._supports_humidity:
             self._attr_supported_features |= ClimateEntityFeature.TARGET_HUMIDITY
             self._attr_min_humidity = 40
             self._attr_max_humidity = 60
 
-    def _get_device_info(self) -> DeviceInfo:
-        """Get device information for this AC unit."""
-        return DeviceInfo(
-            identifiers={("aircloudhome", f"{self.coordinator.config_entry.entry_id}_{self._device['id']}")},
-            name=self._device.get("name", f"AC Unit {self._device['id']}"),
-            manufacturer=self._device.get("model"),
-            serial_number=self._device.get("serialNumber"),
-            hw_version=self._device.get("vendorThingId"),
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up this device's record from the latest coordinator data."""
+        # Keep the last record if the device disappeared so state properties
+        # stay readable; the entity reports unavailable instead.
+        if (device := self.coordinator.get_device(self._device_id)) is not None:
+            self._device = device
+            self._view = self.coordinator.get_climate_view(self._device_id) or build_climate_view(device)
+        self._device_listed = device is not None
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._device.get("online", False)
+        return self._device_listed and self._device.online
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether the state is last-known rather than freshly fetched."""
+        return {"stale": self.coordinator.is_device_stale(self._device_id)}
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self._device.get("roomTemperature")
+        return self._device.room_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        return self._device.get("iduTemperature")
+        return self._device.idu_temperature
 
     @property
     def target_humidity(self) -> int | None:
         """Return the target humidity."""
-        return self._device.get("humidity")
+        return self._device.humidity
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        if self._device.get("power") == "OFF":
-            return HVACMode.OFF
-
-        api_mode = self._device.get("mode", "UNKNOWN")
-        return API_MODE_TO_HVAC_MODE.get(api_mode, HVACMode.OFF)
+        return self._view.hvac_mode
 
     @property
     def fan_mode(self) -> str | None:
         """Return the fan mode."""
-        api_speed = self._device.get("fanSpeed", "AUTO")
-        return API_FAN_SPEED_TO_HA.get(api_speed, "auto")
+        return self._view.fan_mode
 
     @property
     def swing_mode(self) -> str | None:
         """Return the swing mode."""
-        api_swing = self._device.get("fanSwing", "OFF")
-        return API_SWING_TO_HA.get(api_swing, "off")
+        return self._view.swing_mode
 
     @property
     def preset_mode(self) -> str:
         """Return the current preset mode."""
-        if self._device.get("power") == "ON" and self._device.get("mode") == "DRY_COOL":
-            return PRESET_DRY_COOL
-        return PRESET_NONE
+        return self._view.preset_mode
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -163,7 +164,7 @@ async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         if preset_mode == PRESET_DRY_COOL:
             await self._async_update_device(power="ON", mode="DRY_COOL")
-        elif preset_mode == PRESET_NONE and self._device.get("mode") == "DRY_COOL":
+        elif preset_mode == PRESET_NONE and self._device.mode is OperationMode.DRY_COOL:
             # Fall back to DRY when clearing the DRY_COOL preset
             await self._async_update_device(mode="DRY")
 
@@ -194,60 +195,27 @@ async def _async_update_device(
         idu_temperature: float | None = None,
         humidity: int | None = None,
     ) -> None:
-        """Update device state through the API."""
-        # Use current values for parameters not being updated
-        current_power = self._device.get("power", "ON")
-        current_mode = self._device.get("mode", "AUTO")
-        current_fan_speed = self._device.get("fanSpeed", "AUTO")
-        current_fan_swing = self._device.get("fanSwing", "OFF")
-        current_temp = self._device.get("iduTemperature", 22.0)
-        # humidity is the target humidity setpoint retrieved from the device, not the measured room humidity.
-        target_humidity_raw = self._device.get("humidity")
-        target_humidity_setpoint = (
-            int(round(target_humidity_raw)) if isinstance(target_humidity_raw, (int, float)) else None
-        )
-
-        effective_power = power or current_power
-        effective_mode = mode or current_mode
-        # humidity is only valid for DRY / DRY_COOL modes; sending it in other modes causes a 400 error
-        resolved_humidity = (
-            (humidity if humidity is not None else target_humidity_setpoint)
-            if effective_power == "ON" and effective_mode in HUMIDITY_MODES
-            else None
-        )
-
-        try:
-            await self.coordinator.config_entry.runtime_data.client.async_control_device(
-                rac_id=self._device["id"],
-                family_id=self._device["familyId"],
-                power=effective_power,
-                mode=effective_mode,
-                fan_speed=fan_speed or current_fan_speed,
-                fan_swing=fan_swing or current_fan_swing,
-                idu_temperature=idu_temperature if idu_temperature is not None else current_temp,
-                humidity=resolved_humidity,
+        """
+        Update device state through the coordinator.
+
+        The coordinator merges commands for this device that arrive within a
+        short window into one PUT, so rapid setter calls do not each send a
+        full control command and refresh.
+        The commanded values show up right away through the coordinator's
+        pending-command overlay, which is rolled back if the command fails
+        or is not confirmed in time.
+        """
+        changes = {
+            key: value
+            for key, value in (
+                ("power", power),
+                ("mode", mode),
+                ("fanSpeed", fan_speed),
+                ("fanSwing", fan_swing),
+                ("iduTemperature", idu_temperature),
+                ("humidity", humidity),
             )
+            if value is not None
+        }
 
-            # Update local state immediately for responsiveness
-            if power is not None:
-                self._device["power"] = power
-            if mode is not None:
-                self._device["mode"] = mode
-            if fan_speed is not None:
-                self._device["fanSpeed"] = fan_speed
-            if fan_swing is not None:
-                self._device["fanSwing"] = fan_swing
-            if idu_temperature is not None:
-                self._device["iduTemperature"] = idu_temperature
-            if humidity is not None:
-                self._device["humidity"] = humidity
-
-            self.async_write_ha_state()
-
-            # Refresh data from coordinator
-            await self.coordinator.async_request_refresh()
-
-        except Exception:
-            self._attr_available = False
-            self.async_write_ha_state()
-            raise
+        await self.coordinator.async_send_command(self._device, changes)
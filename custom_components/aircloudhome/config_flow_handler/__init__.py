@@ -8,7 +8,7 @@
 ------------------
 - config_flow.py: Main configuration flow (user setup, reauth, reconfigure)
 - options_flow.py: Options flow for post-setup configuration changes
-- subentry_flow.py: Template for implementing subentry flows (multi-device support)
+- subentry_flow.py: Subentry flow selecting the family groups to poll
 - schemas/: Voluptuous schemas for all forms (user, options, reauth, etc.)
 - validators/: Validation logic for user inputs and credentials
 - handler.py: Backwards compatibility wrapper (imports from above modules)
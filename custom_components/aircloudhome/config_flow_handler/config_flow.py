@@ -5,6 +5,7 @@
 - Initial user setup
 - Reconfiguration of existing entries
 - Reauthentication flow
+- Family group subentries (see subentry_flow.py)
 
 For more information:
 https://developers.home-assistant.io/docs/config_entries_config_flow_handler
@@ -22,9 +23,10 @@
     get_user_schema,
 )
 from custom_components.aircloudhome.config_flow_handler.validators import validate_credentials
-from custom_components.aircloudhome.const import DOMAIN, LOGGER
+from custom_components.aircloudhome.const import DOMAIN, LOGGER, SUBENTRY_TYPE_FAMILY
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 
 if TYPE_CHECKING:
     from custom_components.aircloudhome.config_flow_handler.options_flow import AirCloudHomeOptionsFlow
@@ -71,6 +73,25 @@ def async_get_options_flow(
 
         return AirCloudHomeOptionsFlow()
 
+    @classmethod
+    @callback
+    def async_get_supported_subentry_types(
+        cls,
+        config_entry: config_entries.ConfigEntry,
+    ) -> dict[str, type[config_entries.ConfigSubentryFlow]]:
+        """
+        Return the subentry types supported by this integration.
+
+        Returns:
+            The family group subentry flow, keyed by subentry type.
+
+        """
+        from custom_components.aircloudhome.config_flow_handler.subentry_flow import (  # noqa: PLC0415
+            AirCloudHomeFamilySubentryFlowHandler,
+        )
+
+        return {SUBENTRY_TYPE_FAMILY: AirCloudHomeFamilySubentryFlowHandler}
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
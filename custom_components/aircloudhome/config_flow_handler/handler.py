@@ -6,7 +6,7 @@
 
 - config_flow.py: Main config flow (user, reauth, reconfigure)
 - options_flow.py: Options flow for post-setup configuration
-- subentry_flow.py: Template for future subentry flows
+- subentry_flow.py: Subentry flow for family groups
 - schemas/: Voluptuous schemas for all forms
 - validators/: Validation logic for user inputs
 
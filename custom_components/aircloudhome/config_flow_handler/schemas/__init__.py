@@ -9,6 +9,7 @@
 -----------------
 - config.py: Main config flow schemas (user, reauth, reconfigure)
 - options.py: Options flow schemas
+- family.py: Family group subentry schemas
 
 When schemas grow (>300 lines per file), split further:
 - config/user.py, config/reauth.py, config/reconfigure.py
@@ -25,10 +26,16 @@
     get_reconfigure_schema,
     get_user_schema,
 )
+from custom_components.aircloudhome.config_flow_handler.schemas.family import (
+    get_family_options_schema,
+    get_family_schema,
+)
 from custom_components.aircloudhome.config_flow_handler.schemas.options import get_options_schema
 
 # Re-export all schemas for convenient imports
 __all__ = [
+    "get_family_options_schema",
+    "get_family_schema",
     "get_options_schema",
     "get_reauth_schema",
     "get_reconfigure_schema",
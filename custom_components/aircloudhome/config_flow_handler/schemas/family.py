@@ -0,0 +1,91 @@
+"""
+Family group subentry schemas.
+
+Schemas for the subentry flow that selects which family groups of the
+account are polled, and at which update interval.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from custom_components.aircloudhome.const import CONF_FAMILY_ID, CONF_UPDATE_INTERVAL_MINUTES
+from homeassistant.helpers import selector
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeFamilyGroup
+
+
+def _get_update_interval_selector() -> selector.NumberSelector:
+    """Return the selector for a family group's own update interval."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=1,
+            max=1440,  # 24 hours
+            step=1,
+            unit_of_measurement="min",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
+
+
+def get_family_schema(family_groups: Iterable[AirCloudHomeFamilyGroup]) -> vol.Schema:
+    """
+    Get schema for adding a family group subentry.
+
+    Args:
+        family_groups: The listed family groups that have no subentry yet.
+
+    Returns:
+        Voluptuous schema with the family group (familyId as a string) and
+        an optional update interval.
+
+    """
+    return vol.Schema(
+        {
+            vol.Required(CONF_FAMILY_ID): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[
+                        selector.SelectOptionDict(
+                            value=str(group.family_id),
+                            label=f"{group.name} ({group.role})" if group.role else group.name,
+                        )
+                        for group in family_groups
+                    ],
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                ),
+            ),
+            vol.Optional(CONF_UPDATE_INTERVAL_MINUTES): _get_update_interval_selector(),
+        },
+    )
+
+
+def get_family_options_schema(update_interval: float | None = None) -> vol.Schema:
+    """
+    Get schema for the options of a family group subentry.
+
+    Args:
+        update_interval: The family's current update interval in minutes,
+            or None if it uses the integration's update interval.
+
+    Returns:
+        Voluptuous schema with an optional update interval.
+
+    """
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_UPDATE_INTERVAL_MINUTES,
+                description={"suggested_value": update_interval},
+            ): _get_update_interval_selector(),
+        },
+    )
+
+
+__all__ = [
+    "get_family_options_schema",
+    "get_family_schema",
+]
@@ -18,9 +18,35 @@
 import voluptuous as vol
 
 from custom_components.aircloudhome.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_AUTH_REQUESTS_PER_MINUTE,
+    CONF_DEVICE_FILTER_MODE,
+    CONF_DEVICE_IDS,
+    CONF_DEVICE_NAME_PATTERNS,
+    CONF_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_UPDATE_INTERVAL_MINUTES,
+    CONF_MIN_UPDATE_INTERVAL_SECONDS,
+    CONF_POLL_JITTER_PERCENT,
+    CONF_RAC_TYPE_IDS,
+    CONF_READ_REQUESTS_PER_MINUTE,
+    CONF_TOKEN_REFRESH_PERCENT,
     CONF_UPDATE_INTERVAL_MINUTES,
+    CONF_WRITE_REQUESTS_PER_MINUTE,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_AUTH_REQUESTS_PER_MINUTE,
     DEFAULT_ENABLE_DEBUGGING,
+    DEFAULT_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_MIN_UPDATE_INTERVAL_SECONDS,
+    DEFAULT_POLL_JITTER_PERCENT,
+    DEFAULT_READ_REQUESTS_PER_MINUTE,
+    DEFAULT_TOKEN_REFRESH_PERCENT,
     DEFAULT_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_WRITE_REQUESTS_PER_MINUTE,
+    DEVICE_FILTER_MODE_EXCLUDE,
+    DEVICE_FILTER_MODE_INCLUDE,
 )
 from homeassistant.helpers import selector
 
@@ -51,6 +77,139 @@ def get_options_schema(defaults: Mapping[str, Any] | None = None) -> vol.Schema:
                     mode=selector.NumberSelectorMode.BOX,
                 ),
             ),
+            vol.Optional(
+                CONF_ADAPTIVE_POLLING,
+                default=defaults.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_MIN_UPDATE_INTERVAL_SECONDS,
+                default=defaults.get(CONF_MIN_UPDATE_INTERVAL_SECONDS, DEFAULT_MIN_UPDATE_INTERVAL_SECONDS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=10,
+                    max=3600,
+                    step=1,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_MAX_UPDATE_INTERVAL_MINUTES,
+                default=defaults.get(CONF_MAX_UPDATE_INTERVAL_MINUTES, DEFAULT_MAX_UPDATE_INTERVAL_MINUTES),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=1440,
+                    step=1,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_POLL_JITTER_PERCENT,
+                default=defaults.get(CONF_POLL_JITTER_PERCENT, DEFAULT_POLL_JITTER_PERCENT),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=25,
+                    step=1,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.SLIDER,
+                ),
+            ),
+            vol.Optional(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                default=defaults.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=16,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_READ_REQUESTS_PER_MINUTE,
+                default=defaults.get(CONF_READ_REQUESTS_PER_MINUTE, DEFAULT_READ_REQUESTS_PER_MINUTE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=600,
+                    step=1,
+                    unit_of_measurement="/min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_WRITE_REQUESTS_PER_MINUTE,
+                default=defaults.get(CONF_WRITE_REQUESTS_PER_MINUTE, DEFAULT_WRITE_REQUESTS_PER_MINUTE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=600,
+                    step=1,
+                    unit_of_measurement="/min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_AUTH_REQUESTS_PER_MINUTE,
+                default=defaults.get(CONF_AUTH_REQUESTS_PER_MINUTE, DEFAULT_AUTH_REQUESTS_PER_MINUTE),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=60,
+                    step=1,
+                    unit_of_measurement="/min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_FAMILY_GROUPS_CACHE_TTL_MINUTES,
+                default=defaults.get(CONF_FAMILY_GROUPS_CACHE_TTL_MINUTES, DEFAULT_FAMILY_GROUPS_CACHE_TTL_MINUTES),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=1440,
+                    step=1,
+                    unit_of_measurement="min",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Optional(
+                CONF_TOKEN_REFRESH_PERCENT,
+                default=defaults.get(CONF_TOKEN_REFRESH_PERCENT, DEFAULT_TOKEN_REFRESH_PERCENT),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=50,
+                    max=95,
+                    step=5,
+                    unit_of_measurement="%",
+                    mode=selector.NumberSelectorMode.SLIDER,
+                ),
+            ),
+            vol.Optional(
+                CONF_DEVICE_FILTER_MODE,
+                default=defaults.get(CONF_DEVICE_FILTER_MODE, DEVICE_FILTER_MODE_EXCLUDE),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[DEVICE_FILTER_MODE_EXCLUDE, DEVICE_FILTER_MODE_INCLUDE],
+                    translation_key=CONF_DEVICE_FILTER_MODE,
+                    mode=selector.SelectSelectorMode.LIST,
+                ),
+            ),
+            vol.Optional(
+                CONF_DEVICE_IDS,
+                default=defaults.get(CONF_DEVICE_IDS, []),
+            ): selector.TextSelector(selector.TextSelectorConfig(multiple=True)),
+            vol.Optional(
+                CONF_DEVICE_NAME_PATTERNS,
+                default=defaults.get(CONF_DEVICE_NAME_PATTERNS, []),
+            ): selector.TextSelector(selector.TextSelectorConfig(multiple=True)),
+            vol.Optional(
+                CONF_RAC_TYPE_IDS,
+                default=defaults.get(CONF_RAC_TYPE_IDS, []),
+            ): selector.TextSelector(selector.TextSelectorConfig(multiple=True)),
             vol.Optional(
                 "enable_debugging",
                 default=defaults.get("enable_debugging", DEFAULT_ENABLE_DEBUGGING),
@@ -1,16 +1,12 @@
 """
-Subentry flow template for aircloudhome.
+Subentry flow for aircloudhome.
 
-This module provides a template for implementing subentry flows when needed.
-Subentry flows allow users to add multiple "sub-configurations" under a single
-config entry.
-
-Example use case:
-- Weather integration: Main entry for API credentials, subentries for locations
-- Multi-device integration: Main entry for hub/account, subentries for devices
-
-This file is currently a template/example. Uncomment and adapt when implementing
-subentry support.
+An account can see family groups it does not control, such as families
+shared by relatives. Each family group the user wants in Home Assistant is
+added as a ``family`` subentry holding its familyId, name and the user's
+role, plus its own update interval. Once an entry has family subentries,
+the coordinator never requests the idu-list of any other family group.
+Entries without family subentries poll every listed family group.
 
 For more information:
 https://developers.home-assistant.io/docs/config_entries_config_flow_handler#subentry-flows
@@ -18,89 +14,103 @@
 
 from __future__ import annotations
 
-# Uncomment when implementing subentry flows:
-#
-# from typing import Any
-#
-# from homeassistant import config_entries
-# from homeassistant.config_entries import ConfigSubentryFlow, SubentryFlowResult
-#
-# class ExampleLocationSubentryFlowHandler(ConfigSubentryFlow):
-#     """
-#     Handle subentry flow for adding and modifying locations.
-#
-#     This is an example implementation. Adapt to your integration's needs.
-#     """
-#
-#     async def async_step_user(
-#         self,
-#         user_input: dict[str, Any] | None = None
-#     ) -> SubentryFlowResult:
-#         """User flow to add a new location."""
-#         if user_input is not None:
-#             # Validate and create subentry
-#             return self.async_create_subentry(
-#                 title=user_input["location_name"],
-#                 data=user_input,
-#             )
-#
-#         # Show form to collect location data
-#         return self.async_show_form(
-#             step_id="user",
-#             data_schema=vol.Schema({
-#                 vol.Required("location_name"): str,
-#                 vol.Required("latitude"): float,
-#                 vol.Required("longitude"): float,
-#             })
-#         )
-#
-#     async def async_step_reconfigure(
-#         self,
-#         user_input: dict[str, Any] | None = None
-#     ) -> SubentryFlowResult:
-#         """User flow to modify an existing location."""
-#         config_entry = self._get_entry()
-#         config_subentry = self._get_reconfigure_subentry()
-#
-#         if user_input is not None:
-#             # Validate and update subentry
-#             return self.async_update_subentry(
-#                 config_subentry,
-#                 data=user_input,
-#             )
-#
-#         # Show form pre-filled with current values
-#         return self.async_show_form(
-#             step_id="reconfigure",
-#             data_schema=vol.Schema({
-#                 vol.Required(
-#                     "location_name",
-#                     default=config_subentry.data.get("location_name")
-#                 ): str,
-#                 vol.Required(
-#                     "latitude",
-#                     default=config_subentry.data.get("latitude")
-#                 ): float,
-#                 vol.Required(
-#                     "longitude",
-#                     default=config_subentry.data.get("longitude")
-#                 ): float,
-#             })
-#         )
-#
-#
-# # Add to main ConfigFlow class:
-# #
-# # @classmethod
-# # @callback
-# # def async_get_supported_subentry_types(
-# #     cls,
-# #     config_entry: ConfigEntry
-# # ) -> dict[str, type[ConfigSubentryFlow]]:
-# #     """Return subentries supported by this integration."""
-# #     return {
-# #         "location": ExampleLocationSubentryFlowHandler
-# #     }
-
-
-__all__: list[str] = []  # Empty until subentry flows are implemented
+from typing import Any
+
+from custom_components.aircloudhome.config_flow_handler.schemas import get_family_options_schema, get_family_schema
+from custom_components.aircloudhome.const import (
+    CONF_FAMILY_ID,
+    CONF_FAMILY_NAME,
+    CONF_ROLE,
+    CONF_UPDATE_INTERVAL_MINUTES,
+    SUBENTRY_TYPE_FAMILY,
+)
+from homeassistant.config_entries import ConfigEntryState, ConfigSubentryFlow, SubentryFlowResult
+
+
+class AirCloudHomeFamilySubentryFlowHandler(ConfigSubentryFlow):
+    """
+    Handle subentry flow for selecting family groups.
+
+    Family groups are offered from the listing of the loaded entry's
+    coordinator, so adding one needs no extra request.
+    """
+
+    async def async_step_user(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> SubentryFlowResult:
+        """
+        Add a family group to poll.
+
+        Args:
+            user_input: The selected family group and its update interval,
+                or None for initial display.
+
+        Returns:
+            The subentry flow result, either showing a form, creating the
+            subentry, or aborting if no family group can be added.
+
+        """
+        entry = self._get_entry()
+        if entry.state is not ConfigEntryState.LOADED:
+            return self.async_abort(reason="entry_not_loaded")
+
+        added = {
+            subentry.data[CONF_FAMILY_ID]
+            for subentry in entry.subentries.values()
+            if subentry.subentry_type == SUBENTRY_TYPE_FAMILY
+        }
+        available = {
+            family_id: group
+            for family_id, group in entry.runtime_data.coordinator.family_groups.items()
+            if family_id not in added
+        }
+
+        if user_input is not None and (group := available.get(int(user_input[CONF_FAMILY_ID]))) is not None:
+            data: dict[str, Any] = {
+                CONF_FAMILY_ID: group.family_id,
+                CONF_FAMILY_NAME: group.name,
+                CONF_ROLE: group.role,
+            }
+            if CONF_UPDATE_INTERVAL_MINUTES in user_input:
+                data[CONF_UPDATE_INTERVAL_MINUTES] = user_input[CONF_UPDATE_INTERVAL_MINUTES]
+            return self.async_create_entry(title=group.name, data=data, unique_id=str(group.family_id))
+
+        if not available:
+            return self.async_abort(reason="no_families")
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=get_family_schema(available.values()),
+        )
+
+    async def async_step_reconfigure(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> SubentryFlowResult:
+        """
+        Change the options of a family group.
+
+        Args:
+            user_input: The family's update interval, or None for initial display.
+                Leaving the interval empty makes the family use the
+                integration's update interval.
+
+        Returns:
+            The subentry flow result, either showing a form or updating the subentry.
+
+        """
+        subentry = self._get_reconfigure_subentry()
+
+        if user_input is not None:
+            data = {key: value for key, value in subentry.data.items() if key != CONF_UPDATE_INTERVAL_MINUTES}
+            return self.async_update_and_abort(self._get_entry(), subentry, data=data | user_input)
+
+        return self.async_show_form(
+            step_id="reconfigure",
+            data_schema=get_family_options_schema(subentry.data.get(CONF_UPDATE_INTERVAL_MINUTES)),
+            description_placeholders={"family_name": subentry.title},
+        )
+
+
+__all__ = ["AirCloudHomeFamilySubentryFlowHandler"]
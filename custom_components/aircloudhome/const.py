@@ -1,5 +1,6 @@
 """Constants for aircloudhome."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -8,12 +9,96 @@
 DOMAIN = "aircloudhome"
 ATTRIBUTION = "Data provided by AirCloud Home (Hitachi)"
 
+# Token persistence
+TOKEN_STORAGE_VERSION = 1
+TOKEN_SAVE_DELAY = 10  # seconds
+TOKEN_REFRESH_RETRY_DELAY = 300  # seconds
+
+# Last successful device snapshot, used to create entities at startup
+# without waiting for the first refresh
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 30  # seconds
+
+# Commands for the same device within this window are merged into one PUT
+COMMAND_DEBOUNCE_SECONDS = 0.5
+
+# After a command, poll only the device's family until the change shows up
+COMMAND_CONFIRM_INITIAL_DELAY = 2.0  # seconds
+COMMAND_CONFIRM_MAX_DELAY = 8.0  # seconds
+COMMAND_CONFIRM_TIMEOUT = 30.0  # seconds
+
+# Adaptive polling: poll at the minimum interval this long after a command,
+# and back off once nothing changed for this many refreshes
+ADAPTIVE_POLLING_COMMAND_BOOST = 300  # seconds
+ADAPTIVE_POLLING_IDLE_CYCLES = 3
+
+# Transient failures of read requests during a refresh are retried with
+# exponentially growing, fully jittered delays within a per-refresh budget
+UPDATE_RETRY_MAX_RETRIES = 3
+UPDATE_RETRY_BASE_DELAY = 1.0  # seconds
+UPDATE_RETRY_MAX_DELAY = 10.0  # seconds
+UPDATE_RETRY_BUDGET = 30.0  # seconds
+# Next refresh after a transient failure that outlasted the retry budget
+UPDATE_FAILED_RETRY_AFTER = 60  # seconds
+
+# A family group whose idu-list cannot be fetched keeps its last-known
+# devices for this long before they are dropped
+FAMILY_STALE_MAX_AGE = timedelta(minutes=30)
+
+# A device is only removed once this many successful fetches of its family
+# in a row no longer listed it; a family group once this many listings in a
+# row left it out
+DEVICE_REMOVAL_POLLS = 3
+
 # Platform parallel updates - applied to all platforms
 PARALLEL_UPDATES = 1
 
 # Default configuration values
 DEFAULT_UPDATE_INTERVAL_MINUTES = 5
 DEFAULT_ENABLE_DEBUGGING = False
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_FAMILY_GROUPS_CACHE_TTL_MINUTES = 60
+DEFAULT_TOKEN_REFRESH_PERCENT = 80
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MIN_UPDATE_INTERVAL_SECONDS = 60
+DEFAULT_MAX_UPDATE_INTERVAL_MINUTES = 30
+DEFAULT_POLL_JITTER_PERCENT = 5
+DEFAULT_READ_REQUESTS_PER_MINUTE = 0
+DEFAULT_WRITE_REQUESTS_PER_MINUTE = 0
+DEFAULT_AUTH_REQUESTS_PER_MINUTE = 0
 
 # Configuration option keys
 CONF_UPDATE_INTERVAL_MINUTES = "update_interval_minutes"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_FAMILY_GROUPS_CACHE_TTL_MINUTES = "family_groups_cache_ttl_minutes"
+CONF_TOKEN_REFRESH_PERCENT = "token_refresh_percent"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_UPDATE_INTERVAL_SECONDS = "min_update_interval_seconds"
+CONF_MAX_UPDATE_INTERVAL_MINUTES = "max_update_interval_minutes"
+# Polls of all config entries are spread over the update interval; this
+# share of the interval is randomly added or subtracted on every poll
+CONF_POLL_JITTER_PERCENT = "poll_jitter_percent"
+# Requests per minute allowed by the rate limiter shared by all config
+# entries (the lowest value of any entry applies; 0 disables the limit)
+CONF_READ_REQUESTS_PER_MINUTE = "read_requests_per_minute"
+CONF_WRITE_REQUESTS_PER_MINUTE = "write_requests_per_minute"
+CONF_AUTH_REQUESTS_PER_MINUTE = "auth_requests_per_minute"
+
+# Device filter: units matching any ID, name pattern or racTypeId are
+# excluded, or with the include mode, only matching units are kept
+CONF_DEVICE_FILTER_MODE = "device_filter_mode"
+CONF_DEVICE_IDS = "device_ids"
+CONF_DEVICE_NAME_PATTERNS = "device_name_patterns"
+CONF_RAC_TYPE_IDS = "rac_type_ids"
+DEVICE_FILTER_MODE_EXCLUDE = "exclude"
+DEVICE_FILTER_MODE_INCLUDE = "include"
+
+# Family group subentries: when an entry has any, only their family groups
+# are polled. Each may set its own update interval (CONF_UPDATE_INTERVAL_MINUTES).
+SUBENTRY_TYPE_FAMILY = "family"
+CONF_FAMILY_ID = "family_id"
+CONF_FAMILY_NAME = "family_name"
+CONF_ROLE = "role"
+
+# Service actions
+SERVICE_REDISCOVER_DEVICES = "rediscover_devices"
@@ -6,9 +6,17 @@
 
 Package structure:
 - base.py: Main coordinator class (AirCloudHomeDataUpdateCoordinator)
+- commands.py: Command merging and targeted confirmation polling
 - data_processing.py: Data validation, transformation, and caching utilities
+- device_filter.py: Include/exclude filter for AC units
+- device_sync.py: Entity creation for added devices and removal of removed ones
 - error_handling.py: Error recovery strategies and retry logic
+- family.py: Per-family coordinator polling one family group's devices
+- family_manager.py: Family group selection and family coordinator lifetime
 - listeners.py: Event listeners and entity callbacks
+- polling.py: Adaptive update interval policy
+- scheduling.py: Phase offsets and jitter spreading polls across config entries
+- snapshot_store.py: Persist the last successful snapshot for warm starts (HA Store)
 
 For more information on coordinators:
 https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -17,5 +25,13 @@
 from __future__ import annotations
 
 from .base import AirCloudHomeDataUpdateCoordinator
+from .family import AirCloudHomeFamilyCoordinator
+from .scheduling import AirCloudHomePollScheduler
+from .snapshot_store import AirCloudHomeSnapshotStore
 
-__all__ = ["AirCloudHomeDataUpdateCoordinator"]
+__all__ = [
+    "AirCloudHomeDataUpdateCoordinator",
+    "AirCloudHomeFamilyCoordinator",
+    "AirCloudHomePollScheduler",
+    "AirCloudHomeSnapshotStore",
+]
@@ -5,30 +5,86 @@
 and updates for all entities in the integration. It handles refresh cycles,
 error handling, and triggers reauthentication when needed.
 
+The main coordinator lists family groups and keeps one
+``AirCloudHomeFamilyCoordinator`` (family.py) per family, which polls that
+family's idu-list on its own interval. Their results are combined into one
+snapshot here; family_manager.py creates and stops the family coordinators,
+and device_sync.py adds and removes devices after each refresh.
+
 For more information on coordinators:
 https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+from datetime import timedelta
+import itertools
+import logging
+import time
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from custom_components.aircloudhome.api import AirCloudHomeApiClientAuthenticationError, AirCloudHomeApiClientError
-from custom_components.aircloudhome.const import LOGGER
+from custom_components.aircloudhome.const import (
+    COMMAND_CONFIRM_INITIAL_DELAY,
+    COMMAND_CONFIRM_MAX_DELAY,
+    COMMAND_CONFIRM_TIMEOUT,
+    COMMAND_DEBOUNCE_SECONDS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_POLL_JITTER_PERCENT,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_POLL_JITTER_PERCENT,
+    FAMILY_STALE_MAX_AGE,
+    LOGGER,
+    UPDATE_RETRY_BUDGET,
+)
+from custom_components.aircloudhome.data import (
+    EMPTY_MAPPING,
+    AirCloudHomeClimateView,
+    AirCloudHomeDevice,
+    AirCloudHomeFamilyGroup,
+    AirCloudHomeFamilyStatus,
+    AirCloudHomeSnapshot,
+)
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .commands import (
+    AirCloudHomeCommandAggregator,
+    AirCloudHomePendingCommand,
+    async_poll_until_confirmed,
+    build_control_fields,
+    is_device_reflecting,
+)
+from .data_processing import build_climate_view, cache_computed_values, is_record_outdated, transform_api_data
+from .device_filter import AirCloudHomeDeviceFilter
+from .device_sync import AirCloudHomeDeviceSync
+from .error_handling import async_call_with_retry, build_update_failed, handle_partial_data
+from .family_manager import AirCloudHomeFamilyManager
+from .listeners import changed_fields, notify_listeners, track_update_performance
 
 if TYPE_CHECKING:
+    from custom_components.aircloudhome.api import AirCloudHomeApiClient
     from custom_components.aircloudhome.data import AirCloudHomeConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .family import AirCloudHomeFamilyCoordinator
+    from .scheduling import AirCloudHomePollScheduler
 
 
-class AirCloudHomeDataUpdateCoordinator(DataUpdateCoordinator):
+class AirCloudHomeDataUpdateCoordinator(DataUpdateCoordinator[AirCloudHomeSnapshot]):
     """
     Class to manage fetching data from the API.
 
     This coordinator handles all data fetching for the integration and distributes
     updates to all entities. It manages:
-    - Periodic data updates based on update_interval
+    - Periodic family group listing based on update_interval, with one
+      family coordinator per family group polling its devices
     - Error handling and recovery
     - Authentication failure detection and reauthentication triggers
     - Data distribution to all entities
@@ -39,9 +95,81 @@ class AirCloudHomeDataUpdateCoordinator(DataUpdateCoordinator):
 
     Attributes:
         config_entry: The config entry for this integration instance.
+        device_filter: The AC units to keep, from the options.
+        family_coordinators: The coordinator polling each family group,
+            keyed by familyId.
+        family_fetch_durations: Seconds spent fetching each family's idu-list
+            during its last refresh, keyed by familyId.
+        family_groups: Every family group listed for the account, including
+            those not selected for polling, keyed by familyId.
+        poll_jitter: Share of the update interval randomly added to or
+            subtracted from every poll, from the options.
+        scheduler: The integration's poll scheduler, which offsets this
+            entry's polls from those of other entries.
+        suppressed_writes: Entity notifications skipped because the entity's
+            device did not change, since the coordinator was created.
     """
 
     config_entry: AirCloudHomeConfigEntry
+    device_filter: AirCloudHomeDeviceFilter
+    family_coordinators: dict[int, AirCloudHomeFamilyCoordinator]
+    family_fetch_durations: dict[int, float]
+    family_groups: dict[int, AirCloudHomeFamilyGroup]
+    poll_jitter: float
+    scheduler: AirCloudHomePollScheduler
+    suppressed_writes: int
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        name: str,
+        config_entry: AirCloudHomeConfigEntry,
+        update_interval: timedelta,
+        *,
+        scheduler: AirCloudHomePollScheduler,
+        always_update: bool = True,
+    ) -> None:
+        """
+        Initialize the coordinator.
+
+        Args:
+            hass: The Home Assistant instance.
+            logger: The logger to use.
+            name: Name of the coordinator, used in logs.
+            config_entry: The config entry for this integration instance.
+            update_interval: How often to list family groups, and to poll
+                families without an interval of their own.
+            scheduler: The integration's poll scheduler.
+            always_update: Whether to notify entities even if data is unchanged.
+        """
+        super().__init__(
+            hass,
+            logger,
+            name=name,
+            config_entry=config_entry,
+            update_interval=update_interval,
+            always_update=always_update,
+        )
+        self.device_filter = AirCloudHomeDeviceFilter.from_options(config_entry.options)
+        self.scheduler = scheduler
+        self.poll_jitter = config_entry.options.get(CONF_POLL_JITTER_PERCENT, DEFAULT_POLL_JITTER_PERCENT) / 100
+        self._families = AirCloudHomeFamilyManager(self)
+        self.family_coordinators = self._families.coordinators
+        self.family_fetch_durations = {}
+        self.family_groups = {}
+        self._commands = AirCloudHomeCommandAggregator(self, COMMAND_DEBOUNCE_SECONDS)
+        self._confirm_tasks: dict[int, asyncio.Task[None]] = {}
+        # Polls and commands draw from one counter, so whether a poll started
+        # after a device's last command is a comparison of two numbers.
+        self._sequence = itertools.count(1)
+        self._pending_commands: dict[int, AirCloudHomePendingCommand] = {}
+        self.suppressed_writes = 0
+        # Devices (and refresh outcome and staleness) entities were last notified about
+        self._notified_devices: dict[int, AirCloudHomeDevice] = {}
+        self._notified_success = True
+        self._notified_stale: frozenset[int] | None = None
+        self._device_sync = AirCloudHomeDeviceSync(self, self._families)
 
     async def _async_setup(self) -> None:
         """
@@ -61,58 +189,86 @@ async def _async_setup(self) -> None:
         # self._device_id = device_info["id"]
         LOGGER.debug("Coordinator setup complete for %s", self.config_entry.entry_id)
 
-    async def _async_update_data(self) -> Any:
+    async def _async_update_data(self) -> AirCloudHomeSnapshot:
         """
         Fetch data from API endpoint.
 
-        This method fetches device data from the AirCloud Home API.
-        It retrieves family group information and the list of indoor units (AC devices).
+        This method lists the family groups of the account and keeps one
+        family coordinator per group. Family coordinators poll their own
+        idu-list; this refresh only fetches the idu-lists of families that
+        have not been fetched yet, such as newly listed ones.
 
         Returns:
-            A dictionary with structure: {
-                "devices": [
-                    {
-                        "id": int,
-                        "name": str,
-                        "power": "ON"|"OFF",
-                        "mode": str,
-                        "iduTemperature": float,
-                        "roomTemperature": float,
-                        "fanSpeed": str,
-                        "fanSwing": str,
-                        "humidity": int,
-                        "online": bool,
-                        "familyId": int,
-                    }
-                ]
-            }
+            A new immutable snapshot. Devices and views that did not change
+            are the objects of the previous snapshot.
+
+            A family whose idu-list could not be fetched keeps its last-known
+            devices for up to ``FAMILY_STALE_MAX_AGE``; its status records the
+            error and when it was last refreshed.
 
         Raises:
             ConfigEntryAuthFailed: If authentication fails, triggers reauthentication.
-            UpdateFailed: If data fetching fails for other reasons, optionally with retry_after.
+            UpdateFailed: If the family groups or every family's idu-list could
+                not be fetched, optionally with retry_after.
         """
+        sequence = next(self._sequence)
         try:
             client = self.config_entry.runtime_data.client
 
+            # Transient read failures are retried until this deadline, so a
+            # network blip costs seconds instead of a whole polling interval.
+            deadline = time.monotonic() + UPDATE_RETRY_BUDGET
+
             # Fetch family groups
-            family_groups = await client.async_get_family_groups()
+            family_groups = await async_call_with_retry(client.async_get_family_groups, deadline=deadline)
             if not family_groups:
+                # Keep the families and their coordinators; the listing is not
+                # cached, so the next refresh asks again
                 LOGGER.warning("No family groups found for user")
-                return {"devices": []}
+                return self.data or AirCloudHomeSnapshot()
 
-            # Fetch devices from all family groups
-            devices = []
+            listed = {}
             for family_group in family_groups:
-                family_id = family_group.get("familyId")
-                if not family_id:
+                if not family_group.get("familyId"):
                     LOGGER.warning("Family group missing familyId")
                     continue
+                group = AirCloudHomeFamilyGroup.from_api(family_group)
+                listed[group.family_id] = group
+            self.family_groups = listed
+
+            # With family subentries, other family groups are never fetched
+            family_ids = list(listed)
+            if (selected := self._families.selected_family_ids()) is not None:
+                family_ids = [family_id for family_id in family_ids if family_id in selected]
+                LOGGER.debug("Polling %d of %d family groups", len(family_ids), len(listed))
+                if not family_ids:
+                    LOGGER.warning("None of the selected family groups is listed for user")
+                    return self.data or AirCloudHomeSnapshot()
+            # Family groups left out of a few listings in a row are still polled
+            family_ids = self._families.families_to_poll(family_ids)
+
+            # Fetch devices of families no family coordinator has fetched yet
+            # concurrently. Results are merged in family-group order so device
+            # order stays stable.
+            unfetched = [
+                family_id
+                for family_id in family_ids
+                if (family := self.family_coordinators.get(family_id)) is None or family.data is None
+            ]
+            started = time.monotonic()
+            idu_lists = await self._async_fetch_idu_lists(client, unfetched, deadline)
+            track_update_performance(time.monotonic() - started)
 
-                idu_list = await client.async_get_idu_list(family_id)
+            results = dict(zip(unfetched, idu_lists, strict=True))
+            families = self._merge_family_results(family_ids, results)
+            devices_by_id = self._index_devices(families)
+            for device_id, pending in list(self._pending_commands.items()):
+                if pending.device.family_id in results or pending.device.family_id not in families:
+                    self._resolve_pending_command(device_id, devices_by_id.get(device_id), sequence)
 
-                for device in idu_list:
-                    device["familyId"] = family_id
-                    devices.append(device)
+            await self._families.async_sync(family_ids)
+            for family_id in results:
+                self.family_coordinators[family_id].data = families[family_id]
         except AirCloudHomeApiClientAuthenticationError as exception:
             LOGGER.warning("Authentication error - %s", exception)
             raise ConfigEntryAuthFailed(
@@ -120,10 +276,547 @@ async def _async_update_data(self) -> Any:
                 translation_key="authentication_failed",
             ) from exception
         except AirCloudHomeApiClientError as exception:
-            LOGGER.exception("Error communicating with API")
-            raise UpdateFailed(
-                translation_domain="aircloudhome",
-                translation_key="update_failed",
-            ) from exception
+            raise build_update_failed(exception, self.update_interval) from exception
+        else:
+            return AirCloudHomeSnapshot(
+                devices_by_id=devices_by_id,
+                families=families,
+                climate_views=cache_computed_values(devices_by_id, self.data),
+            )
+
+    @callback
+    def async_set_family_result(
+        self,
+        family_id: int,
+        result: list[dict[str, Any]] | AirCloudHomeApiClientError,
+        sequence: int,
+    ) -> AirCloudHomeFamilyStatus:
+        """
+        Publish the outcome of a family coordinator's poll.
+
+        The family's status is replaced in a new snapshot. Entities are not
+        notified here; the family coordinator does that once its refresh ends.
+
+        Args:
+            family_id: The family group that was polled.
+            result: The fetched idu-list, or the API error the poll ended with.
+            sequence: The sequence number taken when the poll started.
+
+        Returns:
+            The family's new status.
+        """
+        current = self.data.families if self.data else EMPTY_MAPPING
+        status = self._family_status(family_id, result, current.get(family_id))
+        if family_id not in current:
+            # The family group went away while it was being polled
+            return status
+        families = MappingProxyType({**current, family_id: status})
+        devices_by_id = self._index_devices(families)
+        if not isinstance(result, AirCloudHomeApiClientError):
+            for device_id, pending in list(self._pending_commands.items()):
+                if pending.device.family_id == family_id:
+                    self._resolve_pending_command(device_id, devices_by_id.get(device_id), sequence)
+        self.data = replace(
+            self.data,
+            devices_by_id=devices_by_id,
+            families=families,
+            climate_views=cache_computed_values(devices_by_id, self.data),
+        )
+        return status
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next family group listing on this entry's phase."""
+        self.scheduler.async_schedule_refresh(self, super()._schedule_refresh, self.poll_jitter)
+
+    def next_sequence(self) -> int:
+        """Return the next number of the sequence shared by polls and commands."""
+        return next(self._sequence)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Notify listeners, skipping entities whose device did not change.
+
+        Called after this coordinator's and every family coordinator's
+        refresh, and after commands. The data is diffed field by field against
+        the records entities were last notified about, and the listeners of
+        this and every family coordinator are called. Listeners registered with a device ID as
+        context are only called when that device changed, was added or was
+        removed; all listeners are called when the refresh outcome flips
+        between success and failure or the set of stale devices changes.
+        Listeners without a context always are.
+        """
+        self._device_sync.async_sync()
+        changed = self._async_changed_devices()
+        self.suppressed_writes += notify_listeners(self._listeners.values(), changed)
+        for family in list(self.family_coordinators.values()):
+            self.suppressed_writes += family.async_notify_listeners(changed)
+
+    @callback
+    def async_add_device_listener(self, add_devices: Callable[[list[AirCloudHomeDevice]], None]) -> CALLBACK_TYPE:
+        """
+        Register a callback that creates entities for devices.
+
+        The callback is called right away with every current device, and
+        after each refresh with the devices that were added to the account.
+
+        Args:
+            add_devices: Called with the devices to create entities for.
+
+        Returns:
+            A function that removes the callback, for ``entry.async_on_unload``.
+        """
+        return self._device_sync.async_add_listener(add_devices)
+
+    @callback
+    def _async_changed_devices(self) -> set[int] | None:
+        """
+        Find the devices that changed since listeners were last notified.
+
+        Returns:
+            The IDs of devices that changed, or None if every listener should
+            be notified.
+        """
+        devices = self.data.devices_by_id if self.data else EMPTY_MAPPING
+        if self._pending_commands:
+            devices = {
+                device_id: pending.device if (pending := self._pending_commands.get(device_id)) else device
+                for device_id, device in devices.items()
+            }
+        notify_all = self.last_update_success != self._notified_success
+        self._notified_success = self.last_update_success
+        stale = frozenset(device_id for device_id in devices if self.is_device_stale(device_id))
+        notify_all = notify_all or stale != self._notified_stale
+        self._notified_stale = stale
+
+        changed: set[int] = set(self._notified_devices.keys() - devices.keys())
+        for device_id in changed:
+            del self._notified_devices[device_id]
+        for device_id, device in devices.items():
+            # Unchanged devices are shared between snapshots
+            if (previous := self._notified_devices.get(device_id)) is device:
+                continue
+            if previous is not None and LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Device %s changed: %s", device_id, ", ".join(sorted(changed_fields(previous, device))))
+            changed.add(device_id)
+            self._notified_devices[device_id] = device
+        return None if notify_all else changed
+
+    def get_climate_view(self, device_id: int) -> AirCloudHomeClimateView | None:
+        """
+        Return the precomputed Home Assistant climate values of a device.
+
+        Args:
+            device_id: The device ID (``id`` from the idu-list).
+
+        Returns:
+            The view from the latest data with pending commands applied, or
+            None if the device is not listed.
+        """
+        if not self.data:
+            return None
+        if (pending := self._pending_commands.get(device_id)) is not None:
+            return pending.view
+        return self.data.climate_views.get(device_id)
+
+    def is_device_stale(self, device_id: int) -> bool:
+        """
+        Return whether a device's state is last-known rather than fresh.
+
+        True while the data is restored from storage at startup, or while the
+        device's family group fails to update.
+
+        Args:
+            device_id: The device ID (``id`` from the idu-list).
+        """
+        if not self.data or (device := self.data.devices_by_id.get(device_id)) is None:
+            return False
+        if self.data.restored:
+            return True
+        return (status := self.data.families.get(device.family_id)) is not None and status.stale
+
+    @callback
+    def async_restore(self, snapshot: AirCloudHomeSnapshot) -> None:
+        """
+        Use a snapshot restored from storage until the first live refresh.
+
+        Lets platforms create entities at startup without waiting for the
+        API. Family groups that are no longer selected and devices the
+        device filter drops are left out, and their devices are removed on
+        the first live refresh. Family coordinators are created for the
+        remaining families only; the next refresh fetches them. Listeners
+        are not notified; there are none yet.
+
+        Args:
+            snapshot: The restored snapshot.
+        """
+        selected = self._families.selected_family_ids()
+        families: dict[int, AirCloudHomeFamilyStatus] = {}
+        for family_id, status in snapshot.families.items():
+            if selected is not None and family_id not in selected:
+                self._device_sync.exclude(status.devices)
+                continue
+            devices = {}
+            for device_id, device in status.devices.items():
+                if self.device_filter.allows_device(device):
+                    devices[device_id] = device
+                else:
+                    self._device_sync.exclude((device_id,))
+            families[family_id] = replace(status, devices=MappingProxyType(devices))
+        devices_by_id = self._index_devices(families)
+        self.data = replace(
+            snapshot,
+            devices_by_id=devices_by_id,
+            families=MappingProxyType(families),
+            climate_views=cache_computed_values(devices_by_id, snapshot),
+        )
+        for family_id in families:
+            self._families.async_create(family_id)
+
+    def get_device(self, device_id: int) -> AirCloudHomeDevice | None:
+        """
+        Return the current state of a device.
+
+        Commands that were sent but not yet confirmed by a poll are applied
+        on top of the state the API last reported.
+
+        Args:
+            device_id: The device ID (``id`` from the idu-list).
+
+        Returns:
+            The device from the latest data, or None if the device is not (or
+            no longer) listed.
+        """
+        if not self.data:
+            return None
+        if (pending := self._pending_commands.get(device_id)) is not None:
+            return pending.device
+        return self.data.devices_by_id.get(device_id)
+
+    async def async_rediscover(self) -> None:
+        """
+        Re-list family groups and refresh all devices immediately.
+
+        Invalidates the API client's family group cache so groups that were
+        added or removed since the last listing are picked up without waiting
+        for the cache TTL to expire, then refreshes every family coordinator.
+        """
+        LOGGER.debug("Rediscovering family groups for %s", self.config_entry.entry_id)
+        self.config_entry.runtime_data.client.invalidate_family_groups_cache()
+        await self.async_refresh()
+        await asyncio.gather(*(family.async_refresh() for family in list(self.family_coordinators.values())))
+
+    async def async_send_command(self, device: AirCloudHomeDevice, changes: dict[str, Any]) -> dict[str, Any]:
+        """
+        Send a control command for a device.
+
+        Commands for the same device arriving within a short window are merged
+        into a single PUT; every caller resolves with the merged result.
+
+        Args:
+            device: The device to control.
+            changes: The fields to change, keyed by API field name
+                (``power``, ``mode``, ``fanSpeed``, ``fanSwing``,
+                ``iduTemperature``, ``humidity``).
+
+        Returns:
+            The control API response, including the ``commandId``.
+
+        Raises:
+            AirCloudHomeApiClientError: If the command failed.
+        """
+        return await self._commands.async_send(device, changes)
+
+    async def async_execute_command(self, device: AirCloudHomeDevice, changes: dict[str, Any]) -> dict[str, Any]:
+        """
+        Send one (possibly merged) control command and apply it locally.
+
+        The commanded fields are overlaid on the device before the PUT is
+        sent, so entities update right away; the overlay is rolled back if
+        the command fails.
+
+        Args:
+            device: The device to control. Its latest state is used to fill in
+                the fields that are not changed.
+            changes: The fields to change, keyed by API field name.
+
+        Returns:
+            The control API response.
+
+        Raises:
+            AirCloudHomeApiClientError: If the command failed.
+        """
+        client = self.config_entry.runtime_data.client
+        device = self.get_device(device.id) or device
+        fields = build_control_fields(device, changes)
+        expected = {key: value for key, value in changes.items() if key != "humidity" or fields["humidity"] is not None}
+
+        previous = self._pending_commands.get(device.id)
+        reported = self.data.devices_by_id.get(device.id) if self.data else None
+        pending = AirCloudHomePendingCommand.create(
+            reported or device,
+            {**previous.fields, **expected} if previous is not None else expected,
+            sequence=next(self._sequence),
+            sent_at=time.monotonic(),
+        )
+        self._pending_commands[device.id] = pending
+        self.async_update_listeners()
+        try:
+            result = await client.async_control_device(**fields)
+        except Exception:
+            # Roll back unless a poll or newer command replaced the overlay meanwhile
+            if self._pending_commands.get(device.id) is pending:
+                if previous is not None:
+                    self._pending_commands[device.id] = previous
+                else:
+                    del self._pending_commands[device.id]
+                self.async_update_listeners()
+            raise
+        if self._pending_commands.get(device.id) is pending:
+            self._pending_commands[device.id] = replace(pending, command_id=result.get("commandId"))
+
+        # Poll the device's family faster for a while so changes made
+        # elsewhere (or the unit settling) show up sooner.
+        if (family := self.family_coordinators.get(device.family_id)) is not None:
+            family.async_note_command()
+
+        # Confirm against the affected family only, instead of a full refresh.
+        # A newer command for the device supersedes an older confirmation.
+        if (confirm_task := self._confirm_tasks.pop(device.id, None)) is not None:
+            confirm_task.cancel()
+        self._confirm_tasks[device.id] = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_confirm_command(device, pending.fields),
+            f"{self.name} confirm command {device.id}",
+        )
+        return result
+
+    async def _async_confirm_command(self, device: AirCloudHomeDevice, expected: dict[str, Any]) -> None:
+        """
+        Poll the device's family until it reflects a command, then patch it in.
+
+        Falls back to a regular refresh if the idu-list request fails or the
+        device is no longer listed. If the device did not reflect the command
+        before the deadline, the pending command is rolled back and the
+        reported state is shown instead.
+
+        Args:
+            device: The device the command was sent to.
+            expected: The commanded fields, keyed by API field name.
+        """
+        device_id = device.id
+        sequence = next(self._sequence)
+        try:
+            latest, confirmed = await async_poll_until_confirmed(
+                self.config_entry.runtime_data.client,
+                device.family_id,
+                device_id,
+                expected,
+                initial_delay=COMMAND_CONFIRM_INITIAL_DELAY,
+                max_delay=COMMAND_CONFIRM_MAX_DELAY,
+                timeout=COMMAND_CONFIRM_TIMEOUT,
+            )
+        except AirCloudHomeApiClientError as exception:
+            LOGGER.debug("Command confirmation for device %s failed - %s", device_id, exception)
+            latest = None
+        finally:
+            if self._confirm_tasks.get(device_id) is asyncio.current_task():
+                del self._confirm_tasks[device_id]
+
+        if latest is None:
+            if (family := self.family_coordinators.get(device.family_id)) is not None:
+                await family.async_request_refresh()
+            return
+
+        LOGGER.debug(
+            "Command for device %s %s", device_id, "confirmed" if confirmed else "not confirmed before deadline"
+        )
+        if (current := self.get_device(device_id)) is not None and is_record_outdated(latest, current):
+            LOGGER.debug("Ignoring outdated confirmation record for device %s", device_id)
+            return
+        reported = AirCloudHomeDevice.from_api(latest, device.family_id)
+        pending = self._pending_commands.get(device_id)
+        if not confirmed and pending is not None and pending.sequence < sequence:
+            LOGGER.debug("Rolling back command %s for device %s", pending.command_id, device_id)
+            del self._pending_commands[device_id]
         else:
-            return {"devices": devices}
+            self._resolve_pending_command(device_id, reported, sequence)
+        self._async_store_device(reported)
+
+    def _resolve_pending_command(self, device_id: int, reported: AirCloudHomeDevice | None, sequence: int) -> None:
+        """
+        Settle or keep a device's pending command after a poll.
+
+        A poll that started after the device's last command clears the
+        pending command once the device reports the commanded fields, or
+        rolls it back once the confirmation timeout has passed. Otherwise the
+        commanded fields stay overlaid on the newly reported state.
+
+        Args:
+            device_id: The device ID.
+            reported: The device state from the poll, or None if the device
+                is no longer listed.
+            sequence: The sequence number taken when the poll started.
+        """
+        if (pending := self._pending_commands.get(device_id)) is None:
+            return
+        if reported is None:
+            del self._pending_commands[device_id]
+            return
+        if sequence > pending.sequence:
+            if is_device_reflecting(reported, pending.fields):
+                LOGGER.debug("Command %s for device %s confirmed by poll", pending.command_id, device_id)
+                del self._pending_commands[device_id]
+                return
+            if time.monotonic() - pending.sent_at >= COMMAND_CONFIRM_TIMEOUT:
+                LOGGER.debug(
+                    "Command %s for device %s not reflected in time, rolling back", pending.command_id, device_id
+                )
+                del self._pending_commands[device_id]
+                return
+        self._pending_commands[device_id] = pending.rebase(reported)
+
+    @callback
+    def _async_store_device(self, device: AirCloudHomeDevice) -> None:
+        """
+        Publish a snapshot with one device's reported state replaced and notify entities.
+
+        Does nothing if a refresh removed the device in the meantime. The
+        snapshot is kept if the state did not change; entities are still
+        notified in case its pending command was settled.
+        """
+        current = self.data.devices_by_id.get(device.id) if self.data else None
+        if current is None:
+            return
+        if current != device:
+            self.data = self.data.with_device(device, build_climate_view(device))
+        self.async_update_listeners()
+
+    def _merge_family_results(
+        self,
+        family_ids: list[int],
+        results: dict[int, list[dict[str, Any]] | AirCloudHomeApiClientError],
+    ) -> Mapping[int, AirCloudHomeFamilyStatus]:
+        """
+        Build the per-family status of a refresh from the fetched idu-lists.
+
+        Families that were not fetched keep the status their family
+        coordinator last published.
+
+        Args:
+            family_ids: The family group IDs currently listed, in merge order.
+            results: The fetch results of the families fetched in this refresh.
+
+        Returns:
+            The status of every family, in family-group order.
+
+        Raises:
+            AirCloudHomeApiClientError: The first family's error, if every
+                family was fetched and failed.
+        """
+        previous = self.data.families if self.data else EMPTY_MAPPING
+        families: dict[int, AirCloudHomeFamilyStatus] = {}
+        for family_id in family_ids:
+            if family_id in results:
+                families[family_id] = self._family_status(family_id, results[family_id], previous.get(family_id))
+            elif (status := previous.get(family_id)) is not None:
+                families[family_id] = status
+
+        errors = [result for result in results.values() if isinstance(result, AirCloudHomeApiClientError)]
+        if errors and len(errors) == len(family_ids):
+            raise errors[0]
+        return MappingProxyType(families)
+
+    def _family_status(
+        self,
+        family_id: int,
+        result: list[dict[str, Any]] | AirCloudHomeApiClientError,
+        previous: AirCloudHomeFamilyStatus | None,
+    ) -> AirCloudHomeFamilyStatus:
+        """
+        Build a family's status from the result of fetching its idu-list.
+
+        Args:
+            family_id: The family group that was fetched.
+            result: The idu-list, or the API error fetching it ended with.
+            previous: The family's previous status, if any.
+        """
+        now = dt_util.utcnow()
+        if isinstance(result, AirCloudHomeApiClientError):
+            return handle_partial_data(family_id, result, previous, now=now, max_age=FAMILY_STALE_MAX_AGE)
+        previous_devices = self.data.devices_by_id if self.data else EMPTY_MAPPING
+        devices = MappingProxyType(
+            {
+                device.id: device
+                for device in transform_api_data(result, family_id, previous_devices, self.device_filter)
+            }
+        )
+        if previous is not None and previous.error is not None:
+            LOGGER.info("Family group %s is updating again", family_id)
+        return AirCloudHomeFamilyStatus(devices=devices, last_success=now)
+
+    @staticmethod
+    def _index_devices(families: Mapping[int, AirCloudHomeFamilyStatus]) -> Mapping[int, AirCloudHomeDevice]:
+        """Return the devices of all families by ID, in family-group order."""
+        return MappingProxyType(
+            {device_id: device for status in families.values() for device_id, device in status.devices.items()}
+        )
+
+    async def _async_fetch_idu_lists(
+        self,
+        client: AirCloudHomeApiClient,
+        family_ids: list[int],
+        deadline: float,
+    ) -> list[list[dict[str, Any]] | AirCloudHomeApiClientError]:
+        """
+        Fetch the idu-list of every family group with bounded concurrency.
+
+        At most ``max_concurrent_requests`` (from the options flow) requests are
+        in flight at once. Every fetch runs to completion even if another one
+        fails, so a slow family only delays the cycle by its own latency.
+        Transient failures are retried with backoff; a family waiting to retry
+        does not hold a concurrency slot.
+
+        Args:
+            client: The authenticated API client.
+            family_ids: The family group IDs to fetch, in merge order.
+            deadline: ``time.monotonic()`` value after which no retry starts.
+
+        Returns:
+            One result per family, in the same order as ``family_ids``: the
+            idu-list, or the API error that fetching it ended with.
+
+        Raises:
+            AirCloudHomeApiClientAuthenticationError: If any fetch failed
+                authentication, since that affects every family.
+        """
+        limit = int(self.config_entry.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS))
+        semaphore = asyncio.Semaphore(max(limit, 1))
+        durations: dict[int, float] = {}
+
+        async def _fetch_once(family_id: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    return await client.async_get_idu_list(family_id)
+                finally:
+                    durations[family_id] = time.monotonic() - started
+                    LOGGER.debug("Fetched idu-list for family %s in %.3f s", family_id, durations[family_id])
+
+        async def _fetch(family_id: int) -> list[dict[str, Any]]:
+            return await async_call_with_retry(lambda: _fetch_once(family_id), deadline=deadline)
+
+        results = await asyncio.gather(
+            *(_fetch(family_id) for family_id in family_ids),
+            return_exceptions=True,
+        )
+        self.family_fetch_durations.update(durations)
+
+        for result in results:
+            if isinstance(result, AirCloudHomeApiClientAuthenticationError):
+                raise result
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, AirCloudHomeApiClientError):
+                raise result
+        return results
@@ -0,0 +1,302 @@
+"""
+Device command handling for the coordinator.
+
+This module turns climate entity requests into AirCloud Home control
+commands. The control endpoint always takes the full device state, so every
+setter used to send its own PUT followed by a full refresh. Commands for the
+same device that arrive within a short window are now merged (last write
+wins per field) and sent as one PUT.
+
+Use cases:
+- Dragging a thermostat slider
+- Automations setting mode, fan speed and temperature back-to-back
+
+The control endpoint only returns a ``commandId`` and applies the change
+asynchronously. Instead of a full-account refresh, a command is confirmed by
+polling just the affected family's idu-list until the device reports the
+commanded fields.
+
+Until then, the command is kept in a per-device overlay on top of the
+reported state, so the UI shows the commanded values right away. Polls and
+commands share one sequence counter: a poll that started before the
+device's last command cannot settle the overlay, while a later poll clears
+it once the device reports the fields or rolls it back after a timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field, replace
+import time
+from typing import TYPE_CHECKING, Any, Self
+
+from custom_components.aircloudhome.const import LOGGER
+from custom_components.aircloudhome.entity_utils.climate_mappings import HUMIDITY_MODES
+
+from .data_processing import build_climate_view
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.api import AirCloudHomeApiClient
+    from custom_components.aircloudhome.data import AirCloudHomeClimateView, AirCloudHomeDevice
+
+    from .base import AirCloudHomeDataUpdateCoordinator
+
+
+def build_control_fields(device: AirCloudHomeDevice, changes: dict[str, Any]) -> dict[str, Any]:
+    """
+    Resolve the full set of control parameters for a device.
+
+    Fields that are not being changed are taken from the device's current
+    state, because the control endpoint requires all of them. Control values
+    are echoed as the API reported them, so an unrecognized mode or fan
+    speed is sent back unchanged rather than replaced by a placeholder.
+
+    Args:
+        device: The current device state.
+        changes: The fields to change, keyed by API field name.
+
+    Returns:
+        Keyword arguments for ``AirCloudHomeApiClient.async_control_device``.
+
+    Example:
+        >>> build_control_fields(device, {"fanSpeed": "LV2"})
+        {"rac_id": 1, "family_id": 2, "power": "ON", "mode": "AUTO", "fan_speed": "LV2", ...}
+    """
+    power = changes.get("power") or device.api_power or "ON"
+    mode = changes.get("mode") or device.api_mode or "AUTO"
+
+    # humidity is the target humidity setpoint retrieved from the device, not the measured room humidity.
+    humidity = changes.get("humidity")
+    if humidity is None:
+        humidity = device.humidity
+
+    temperature = changes.get("iduTemperature")
+    if temperature is None:
+        temperature = device.idu_temperature if device.idu_temperature is not None else 22.0
+    return {
+        "rac_id": device.id,
+        "family_id": device.family_id,
+        "power": str(power),
+        "mode": str(mode),
+        "fan_speed": str(changes.get("fanSpeed") or device.api_fan_speed or "AUTO"),
+        "fan_swing": str(changes.get("fanSwing") or device.api_fan_swing or "OFF"),
+        "idu_temperature": temperature,
+        # humidity is only valid for DRY / DRY_COOL modes; sending it in other modes causes a 400 error
+        "humidity": humidity if power == "ON" and mode in HUMIDITY_MODES else None,
+    }
+
+
+def is_device_reflecting(device: AirCloudHomeDevice, expected: dict[str, Any]) -> bool:
+    """
+    Return True when a parsed device reports every commanded field.
+
+    Args:
+        device: The device state from a poll.
+        expected: The commanded fields, keyed by API field name.
+    """
+    return device.with_changes(expected) == device
+
+
+def is_command_reflected(device: dict[str, Any], expected: dict[str, Any]) -> bool:
+    """
+    Return True when a device record reports every commanded field.
+
+    Args:
+        device: A device record from the idu-list.
+        expected: The commanded fields, keyed by API field name.
+
+    Example:
+        >>> is_command_reflected({"power": "ON", "fanSpeed": "LV2"}, {"fanSpeed": "LV2"})
+        True
+    """
+    return all(device.get(key) == value for key, value in expected.items())
+
+
+async def async_poll_until_confirmed(
+    client: AirCloudHomeApiClient,
+    family_id: int,
+    device_id: int,
+    expected: dict[str, Any],
+    *,
+    initial_delay: float,
+    max_delay: float,
+    timeout: float,
+) -> tuple[dict[str, Any] | None, bool]:
+    """
+    Poll one family's idu-list until a device reflects a command.
+
+    The delay between polls doubles from ``initial_delay`` up to
+    ``max_delay``; polling stops once the device reports every expected field
+    or the next poll would start after ``timeout`` seconds.
+
+    Args:
+        client: The authenticated API client.
+        family_id: The family group the device belongs to.
+        device_id: The device the command was sent to.
+        expected: The commanded fields, keyed by API field name.
+        initial_delay: Seconds to wait before the first poll.
+        max_delay: Upper bound for the delay between polls.
+        timeout: Overall deadline in seconds.
+
+    Returns:
+        The latest record of the device (``None`` if it was not listed) and
+        whether it reflected the command.
+
+    Raises:
+        AirCloudHomeApiClientError: If an idu-list request failed.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    latest: dict[str, Any] | None = None
+    while True:
+        await asyncio.sleep(delay)
+        idu_list = await client.async_get_idu_list(family_id)
+        latest = next((device for device in idu_list if device.get("id") == device_id), None)
+        if latest is None:
+            return None, False
+        if is_command_reflected(latest, expected):
+            return latest, True
+        delay = min(delay * 2, max_delay)
+        if time.monotonic() + delay > deadline:
+            return latest, False
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomePendingCommand:
+    """
+    Overlay of a device's unconfirmed commands on top of its reported state.
+
+    Attributes:
+        sequence: The sequence number of the device's last command.
+        sent_at: When the last command was sent (monotonic seconds).
+        command_id: The ``commandId`` the control API returned, or None while
+            the command is being sent.
+        fields: The commanded fields of all unconfirmed commands, keyed by
+            API field name.
+        device: The reported device state with ``fields`` applied.
+        view: The climate view of ``device``.
+    """
+
+    sequence: int
+    sent_at: float
+    command_id: str | None
+    fields: dict[str, Any]
+    device: AirCloudHomeDevice
+    view: AirCloudHomeClimateView
+
+    @classmethod
+    def create(
+        cls,
+        reported: AirCloudHomeDevice,
+        fields: dict[str, Any],
+        *,
+        sequence: int,
+        sent_at: float,
+    ) -> Self:
+        """
+        Overlay commanded fields on a device's reported state.
+
+        Args:
+            reported: The device state last reported by the API.
+            fields: The commanded fields, keyed by API field name.
+            sequence: The sequence number of the command.
+            sent_at: When the command was sent (monotonic seconds).
+        """
+        device = reported.with_changes(fields)
+        return cls(sequence, sent_at, None, fields, device, build_climate_view(device))
+
+    def rebase(self, reported: AirCloudHomeDevice) -> Self:
+        """
+        Return the overlay applied to a newer reported state.
+
+        Returns the overlay itself if the result did not change, so the
+        device keeps its identity.
+        """
+        device = reported.with_changes(self.fields)
+        if device == self.device:
+            return self
+        return replace(self, device=device, view=build_climate_view(device))
+
+
+@dataclass
+class _CommandBatch:
+    """Changes collected for one device during the debounce window."""
+
+    device: AirCloudHomeDevice
+    future: asyncio.Future[dict[str, Any]]
+    changes: dict[str, Any] = field(default_factory=dict)
+
+
+class AirCloudHomeCommandAggregator:
+    """
+    Merge rapid commands per device into a single control PUT.
+
+    The first command for a device opens a batch and schedules a flush after
+    ``window`` seconds. Commands arriving before the flush are merged into the
+    batch, last write wins per field, and every caller awaits the same result.
+    Batches for one device are sent strictly in order.
+    """
+
+    def __init__(self, coordinator: AirCloudHomeDataUpdateCoordinator, window: float) -> None:
+        """
+        Initialize the aggregator.
+
+        Args:
+            coordinator: The coordinator owning the API client and device data.
+            window: Seconds to wait for further commands before sending.
+
+        """
+        self._coordinator = coordinator
+        self._window = window
+        self._batches: dict[int, _CommandBatch] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    async def async_send(self, device: AirCloudHomeDevice, changes: dict[str, Any]) -> dict[str, Any]:
+        """
+        Queue field changes for a device and wait until they are sent.
+
+        Args:
+            device: The device to control.
+            changes: The fields to change, keyed by API field name.
+
+        Returns:
+            The control API response for the merged command.
+
+        Raises:
+            AirCloudHomeApiClientError: If the merged command failed.
+        """
+        device_id = device.id
+        if (batch := self._batches.get(device_id)) is None:
+            batch = _CommandBatch(device=device, future=self._coordinator.hass.loop.create_future())
+            self._batches[device_id] = batch
+            self._coordinator.config_entry.async_create_background_task(
+                self._coordinator.hass,
+                self._async_flush(device_id, batch),
+                f"{self._coordinator.name} command {device_id}",
+            )
+        batch.device = device
+        batch.changes.update(changes)
+
+        # Shield so one caller being cancelled does not cancel the others.
+        return await asyncio.shield(batch.future)
+
+    async def _async_flush(self, device_id: int, batch: _CommandBatch) -> None:
+        """Send a batch once its window has passed."""
+        try:
+            await asyncio.sleep(self._window)
+            # Close the batch; commands from now on open the next one.
+            if self._batches.get(device_id) is batch:
+                del self._batches[device_id]
+
+            async with self._locks.setdefault(device_id, asyncio.Lock()):
+                LOGGER.debug("Sending merged command for device %s: %s", device_id, batch.changes)
+                try:
+                    result = await self._coordinator.async_execute_command(batch.device, batch.changes)
+                except Exception as exception:  # noqa: BLE001 - Re-raised to every waiting caller
+                    batch.future.set_exception(exception)
+                else:
+                    batch.future.set_result(result)
+        finally:
+            # Cancelled on unload: release the callers instead of leaving them waiting.
+            if not batch.future.done():
+                batch.future.cancel()
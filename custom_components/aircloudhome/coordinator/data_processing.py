@@ -13,83 +13,212 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from custom_components.aircloudhome.const import LOGGER
+from custom_components.aircloudhome.data import (
+    EMPTY_MAPPING,
+    AirCloudHomeClimateView,
+    AirCloudHomeDevice,
+    AirCloudHomeSnapshot,
+    OperationMode,
+    Power,
+)
+from custom_components.aircloudhome.entity_utils.climate_mappings import (
+    API_FAN_SPEED_TO_HA,
+    API_MODE_TO_HVAC_MODE,
+    API_SWING_TO_HA,
+    PRESET_DRY_COOL,
+)
+from homeassistant.components.climate import FAN_AUTO, PRESET_NONE, SWING_OFF, HVACMode
+
+if TYPE_CHECKING:
+    from .device_filter import AirCloudHomeDeviceFilter
 
 
 def validate_api_response(data: Any) -> bool:
     """
-    Validate the structure and content of API response data.
+    Validate the structure of one idu-list device record.
 
     Args:
-        data: The raw data received from the API.
+        data: One raw record from the idu-list response.
 
     Returns:
-        True if the data is valid, False otherwise.
+        True if the record can be parsed, False otherwise.
 
     Example:
-        >>> data = {"userId": 1, "id": 1, "title": "Test"}
-        >>> validate_api_response(data)
+        >>> validate_api_response({"id": 10001, "power": "ON"})
         True
+        >>> validate_api_response({"power": "ON"})
+        False
     """
     if not isinstance(data, dict):
         LOGGER.warning("Invalid API response: expected dict, got %s", type(data).__name__)
         return False
 
-    # Add validation logic based on your API structure
-    # This is a placeholder for future implementation
+    if not isinstance(data.get("id"), int) or isinstance(data["id"], bool):
+        LOGGER.warning("Invalid device record: missing or non-integer id")
+        return False
     return True
 
 
-def transform_api_data(raw_data: Any) -> dict[str, Any]:
+def is_record_outdated(record: Mapping[str, Any], known: AirCloudHomeDevice) -> bool:
+    """
+    Return whether an idu-list record is older than the state already held.
+
+    Protects against out-of-order responses, e.g. a slow poll finishing after
+    a command confirmation fetched newer data.
+
+    Args:
+        record: A raw idu-list record.
+        known: The device state currently held.
+
+    Example:
+        >>> is_record_outdated({"id": 10001, "updatedAt": 1699999999000}, device)  # device.updated_at=1700000000000
+        True
+    """
+    updated_at = record.get("updatedAt")
+    return isinstance(updated_at, int) and known.updated_at is not None and updated_at < known.updated_at
+
+
+def is_record_unchanged(record: Mapping[str, Any], known: AirCloudHomeDevice) -> bool:
     """
-    Transform raw API data into a standardized format for entities.
+    Return whether an idu-list record carries the same update timestamps as the state held.
 
-    This function can be used to:
-    - Normalize field names
-    - Convert units
-    - Calculate derived values
-    - Restructure nested data
+    The API advances ``updatedAt`` when the unit reports new state and
+    ``lastOnlineUpdatedAt`` when its connectivity changes, so a record with
+    both unchanged does not need to be parsed again.
 
     Args:
-        raw_data: The raw data from the API.
+        record: A raw idu-list record.
+        known: The device state currently held.
+    """
+    return (
+        known.updated_at is not None
+        and record.get("updatedAt") == known.updated_at
+        and record.get("lastOnlineUpdatedAt") == known.last_online_updated_at
+    )
+
+
+def transform_api_data(
+    raw_data: Any,
+    family_id: int,
+    previous: Mapping[int, AirCloudHomeDevice] = EMPTY_MAPPING,
+    device_filter: AirCloudHomeDeviceFilter | None = None,
+) -> list[AirCloudHomeDevice]:
+    """
+    Parse a family's idu-list into device models.
+
+    Runs once per family per refresh, so entities read plain attributes
+    instead of looking up raw JSON keys. Invalid records are skipped. A
+    device that did not change is returned as the previous object, so later
+    stages can detect changes with an identity check.
+
+    The previous devices carry the last seen ``updatedAt`` per device. A
+    record whose timestamps have not moved is not parsed at all, and one
+    with an older ``updatedAt`` is rejected in favour of the state held.
+    Records the device filter drops are skipped before any of this.
+
+    Args:
+        raw_data: The idu-list response.
+        family_id: The family group the list belongs to.
+        previous: The devices of the previous snapshot, by ID.
+        device_filter: The units to keep, if a filter is configured.
 
     Returns:
-        A dictionary with transformed data ready for entity consumption.
+        The parsed devices, in idu-list order.
 
     Example:
-        >>> raw = {"temp_c": 25.5}
-        >>> transform_api_data(raw)
-        {"temperature": 25.5, "temperature_f": 77.9}
+        >>> transform_api_data([{"id": 10001, "power": "ON", "mode": "HEATING"}], 1)
+        [AirCloudHomeDevice(id=10001, family_id=1, power=<Power.ON: 'ON'>, ...)]
     """
-    if not validate_api_response(raw_data):
-        LOGGER.warning("Skipping transformation of invalid data")
-        return raw_data if isinstance(raw_data, dict) else {}
+    if not isinstance(raw_data, list):
+        LOGGER.warning("Invalid idu-list for family %s: expected list, got %s", family_id, type(raw_data).__name__)
+        return []
+
+    devices = []
+    skipped = 0
+    filtered = 0
+    for record in raw_data:
+        if not validate_api_response(record):
+            continue
+        if device_filter is not None and not device_filter.allows(record):
+            filtered += 1
+            continue
+        known = previous.get(record["id"])
+        if known is not None and known.family_id == family_id:
+            if is_record_unchanged(record, known):
+                skipped += 1
+                devices.append(known)
+                continue
+            if is_record_outdated(record, known):
+                LOGGER.debug("Ignoring outdated record for device %s (updatedAt %s)", known.id, record["updatedAt"])
+                devices.append(known)
+                continue
+        device = AirCloudHomeDevice.from_api(record, family_id)
+        devices.append(known if known == device else device)
+    if skipped:
+        LOGGER.debug("Family %s: %d of %d devices not updated since the last refresh", family_id, skipped, len(devices))
+    if filtered:
+        LOGGER.debug("Family %s: %d devices excluded by the device filter", family_id, filtered)
+    return devices
+
+
+def build_climate_view(device: AirCloudHomeDevice) -> AirCloudHomeClimateView:
+    """
+    Map a device's API state to Home Assistant climate values.
 
-    # Transform data as needed
-    # This is a placeholder for future implementation
-    return raw_data
+    Args:
+        device: The parsed device state.
 
+    Returns:
+        The HVAC mode, fan mode, swing mode and preset for the device.
 
-def cache_computed_values(data: dict[str, Any]) -> dict[str, Any]:
+    Example:
+        >>> build_climate_view(device)  # power ON, mode DRY_COOL, fan LV2, swing AUTO
+        AirCloudHomeClimateView(hvac_mode=<HVACMode.DRY: 'dry'>, fan_mode="level_2", swing_mode="on", ...)
+    """
+    powered = device.power is Power.ON
+    return AirCloudHomeClimateView(
+        hvac_mode=API_MODE_TO_HVAC_MODE.get(device.mode, HVACMode.OFF) if powered else HVACMode.OFF,
+        fan_mode=API_FAN_SPEED_TO_HA.get(device.fan_speed, FAN_AUTO),
+        swing_mode=API_SWING_TO_HA.get(device.fan_swing, SWING_OFF),
+        preset_mode=PRESET_DRY_COOL if powered and device.mode is OperationMode.DRY_COOL else PRESET_NONE,
+    )
+
+
+def cache_computed_values(
+    devices: Mapping[int, AirCloudHomeDevice],
+    previous: AirCloudHomeSnapshot | None,
+) -> Mapping[int, AirCloudHomeClimateView]:
     """
-    Add computed or cached values to the coordinator data.
+    Compute the Home Assistant climate view of every device.
 
-    This is useful for expensive calculations that should only be done once
-    per update cycle rather than in each entity.
+    Runs once per refresh rather than on every entity property access. The
+    previous view is reused for devices that are the same object as in the
+    previous snapshot.
 
     Args:
-        data: The base data dictionary.
+        devices: The devices of the new snapshot, by ID.
+        previous: The previous snapshot, if any.
 
     Returns:
-        The data dictionary with additional computed values.
+        The climate views, keyed by device ID.
 
     Example:
-        >>> data = {"power": 1000, "runtime": 3600}
-        >>> cache_computed_values(data)
-        {"power": 1000, "runtime": 3600, "energy_kwh": 1.0}
+        >>> cache_computed_values({10001: device}, None)
+        {10001: AirCloudHomeClimateView(hvac_mode=<HVACMode.HEAT: 'heat'>, ...)}
     """
-    # Add computed values as needed
-    # This is a placeholder for future implementation
-    return data
+    views: dict[int, AirCloudHomeClimateView] = {}
+    for device_id, device in devices.items():
+        if (
+            previous is not None
+            and previous.devices_by_id.get(device_id) is device
+            and (view := previous.climate_views.get(device_id)) is not None
+        ):
+            views[device_id] = view
+        else:
+            views[device_id] = build_climate_view(device)
+    return MappingProxyType(views)
@@ -0,0 +1,147 @@
+"""
+Device filter for the coordinator.
+
+Accounts can expose many AC units that should not be in Home Assistant.
+The filter from the options flow matches units by ID, name pattern or
+``racTypeId`` and either excludes the matching units or includes only them.
+It is applied to the raw idu-list records, so a filtered-out unit is never
+parsed, gets no entity and causes no state writes.
+
+Name patterns are shell-style wildcards (``*``, ``?``, ``[...]``) matched
+case-insensitively against the whole unit name.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any, Self
+
+from custom_components.aircloudhome.const import (
+    CONF_DEVICE_FILTER_MODE,
+    CONF_DEVICE_IDS,
+    CONF_DEVICE_NAME_PATTERNS,
+    CONF_RAC_TYPE_IDS,
+    DEVICE_FILTER_MODE_INCLUDE,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeDevice
+
+
+def _parse_ids(values: Iterable[Any], option: str) -> frozenset[int]:
+    """Return the integer IDs of an option, ignoring invalid entries."""
+    ids = set()
+    for value in values:
+        try:
+            ids.add(int(str(value).strip()))
+        except ValueError:
+            LOGGER.warning("Ignoring invalid value %r in %s", value, option)
+    return frozenset(ids)
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomeDeviceFilter:
+    """
+    Decide which AC units are kept.
+
+    A unit matches if its ID, name or ``racTypeId`` matches any criterion.
+    With no criteria configured, every unit is kept in either mode.
+
+    Attributes:
+        include: Whether only matching units are kept (otherwise matching
+            units are dropped).
+        device_ids: Unit IDs to match.
+        name_patterns: Lower-cased shell-style patterns to match unit names.
+        rac_type_ids: ``racTypeId`` values to match.
+    """
+
+    include: bool = False
+    device_ids: frozenset[int] = frozenset()
+    name_patterns: tuple[str, ...] = ()
+    rac_type_ids: frozenset[int] = frozenset()
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> Self:
+        """
+        Build the filter from config entry options.
+
+        Args:
+            options: The config entry options.
+
+        Returns:
+            The device filter. Invalid IDs are ignored with a warning.
+        """
+        return cls(
+            include=options.get(CONF_DEVICE_FILTER_MODE) == DEVICE_FILTER_MODE_INCLUDE,
+            device_ids=_parse_ids(options.get(CONF_DEVICE_IDS, ()), CONF_DEVICE_IDS),
+            name_patterns=tuple(
+                pattern.strip().casefold() for pattern in options.get(CONF_DEVICE_NAME_PATTERNS, ()) if pattern.strip()
+            ),
+            rac_type_ids=_parse_ids(options.get(CONF_RAC_TYPE_IDS, ()), CONF_RAC_TYPE_IDS),
+        )
+
+    @property
+    def active(self) -> bool:
+        """Return whether any criterion is configured."""
+        return bool(self.device_ids or self.name_patterns or self.rac_type_ids)
+
+    def _matches(self, device_id: Any, name: Any, rac_type_id: Any) -> bool:
+        """Return whether a unit matches any criterion."""
+        if device_id in self.device_ids or rac_type_id in self.rac_type_ids:
+            return True
+        if self.name_patterns and isinstance(name, str):
+            name = name.casefold()
+            return any(fnmatchcase(name, pattern) for pattern in self.name_patterns)
+        return False
+
+    def allows(self, record: Mapping[str, Any]) -> bool:
+        """
+        Return whether an idu-list record is kept.
+
+        Args:
+            record: One validated device record from the idu-list.
+
+        Returns:
+            True if the unit passes the filter.
+        """
+        if not self.active:
+            return True
+        return self._matches(record["id"], record.get("name"), record.get("racTypeId")) is self.include
+
+    def allows_device(self, device: AirCloudHomeDevice) -> bool:
+        """
+        Return whether a parsed device is kept.
+
+        Args:
+            device: The device, e.g. from a restored snapshot.
+
+        Returns:
+            True if the unit passes the filter.
+        """
+        if not self.active:
+            return True
+        return self._matches(device.id, device.name, device.rac_type_id) is self.include
+
+    def excludes_registered(self, device_id: int, name: str | None) -> bool:
+        """
+        Return whether a unit known only from the device registry is dropped.
+
+        Only the unit's ID and registered name are known. In include mode
+        with ``racTypeId`` criteria, a unit that matches neither could still
+        match by ``racTypeId``, so it is not reported as dropped.
+
+        Args:
+            device_id: The unit ID.
+            name: The name the unit's device was registered with.
+
+        Returns:
+            True if the filter certainly drops the unit.
+        """
+        if not self.active:
+            return False
+        if self._matches(device_id, name, None):
+            return not self.include
+        return self.include and not self.rac_type_ids
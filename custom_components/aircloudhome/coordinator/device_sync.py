@@ -0,0 +1,192 @@
+"""
+Device discovery and removal for aircloudhome.
+
+Platforms register a callback with the main coordinator that creates
+entities for devices. After each live refresh, this module hands that
+callback the devices that were added to the account, and removes devices
+that are gone from the device registry, which also removes their entities.
+
+A device is only removed once several successful fetches of its family
+group in a row did not list it, so a single short or partial idu-list does
+not delete entities (and their history and customizations).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from custom_components.aircloudhome.const import DEVICE_REMOVAL_POLLS, DOMAIN, LOGGER
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers import device_registry as dr
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeDevice
+
+    from .base import AirCloudHomeDataUpdateCoordinator
+    from .family_manager import AirCloudHomeFamilyManager
+
+
+class AirCloudHomeDeviceSync:
+    """Create entities for added devices and remove those of removed ones."""
+
+    def __init__(self, coordinator: AirCloudHomeDataUpdateCoordinator, families: AirCloudHomeFamilyManager) -> None:
+        """
+        Initialize the device sync.
+
+        Args:
+            coordinator: The main coordinator holding the device data.
+            families: The family manager, which knows the selected family groups.
+        """
+        self._coordinator = coordinator
+        self._families = families
+        # Devices entities were created for, by ID, with their family group
+        # (None for devices only found in the device registry)
+        self._known_devices: dict[int, int | None] = {}
+        # Known devices missing from their family's idu-list: the family's
+        # last_success when that was last counted, and how many fetches in a row
+        self._missing_devices: dict[int, tuple[datetime, int]] = {}
+        self._registry_checked = False
+        # Devices the family selection or the device filter leaves out, from
+        # the restored snapshot and the device registry; these are removed
+        # without waiting for their family to be fetched
+        self._excluded_devices: set[int] = set()
+        self._listeners: list[Callable[[list[AirCloudHomeDevice]], None]] = []
+
+    @callback
+    def async_add_listener(self, add_devices: Callable[[list[AirCloudHomeDevice]], None]) -> CALLBACK_TYPE:
+        """
+        Register a callback that creates entities for devices.
+
+        The callback is called right away with every current device, and
+        after each refresh with the devices that were added to the account.
+
+        Args:
+            add_devices: Called with the devices to create entities for.
+
+        Returns:
+            A function that removes the callback.
+        """
+        self._listeners.append(add_devices)
+        data = self._coordinator.data
+        if data and data.devices_by_id:
+            add_devices(list(data.devices_by_id.values()))
+            self._known_devices.update({device.id: device.family_id for device in data.devices_by_id.values()})
+
+        @callback
+        def _async_remove_listener() -> None:
+            self._listeners.remove(add_devices)
+
+        return _async_remove_listener
+
+    def exclude(self, device_ids: Iterable[int]) -> None:
+        """
+        Mark devices as left out, so they are removed on the first live refresh.
+
+        Args:
+            device_ids: The devices the family selection or the device filter leaves out.
+        """
+        self._excluded_devices.update(device_ids)
+
+    @callback
+    def async_sync(self) -> None:
+        """
+        Create entities for added devices and remove those of removed ones.
+
+        Only live, successful refreshes are considered, and nothing is
+        removed while any family group fails. A device is removed once
+        ``DEVICE_REMOVAL_POLLS`` successful fetches of its family group in a
+        row did not list it, or right away if the family selection or the
+        device filter leaves it out. Devices of a family group that is not
+        listed (for example after an empty listing) are kept; they can be
+        deleted from the device page.
+
+        On the first such refresh, devices registered by an earlier run that
+        are not listed now are picked up as well. Their family group is
+        unknown, so they are only removed if they are left out explicitly.
+        """
+        coordinator = self._coordinator
+        data = coordinator.data
+        if not data or data.restored or not coordinator.last_update_success:
+            return
+        entry_id = coordinator.config_entry.entry_id
+        device_registry = dr.async_get(coordinator.hass)
+        if not self._registry_checked:
+            self._registry_checked = True
+            self._async_load_registered_devices(device_registry)
+        # Devices only found in the registry get entities once they are listed
+        if added := [
+            device for device_id, device in data.devices_by_id.items() if self._known_devices.get(device_id) is None
+        ]:
+            LOGGER.info("Found %d new devices: %s", len(added), ", ".join(str(device.id) for device in added))
+            self._known_devices.update({device.id: device.family_id for device in added})
+            for add_devices in self._listeners:
+                add_devices(added)
+
+        if any(status.stale for status in data.families.values()):
+            return
+        for device_id in self._removed_devices():
+            LOGGER.info("Removing device %s, which is no longer listed", device_id)
+            del self._known_devices[device_id]
+            self._missing_devices.pop(device_id, None)
+            self._excluded_devices.discard(device_id)
+            if device_entry := device_registry.async_get_device(identifiers={(DOMAIN, f"{entry_id}_{device_id}")}):
+                # Removing the entry from the device also removes its entities
+                device_registry.async_update_device(device_entry.id, remove_config_entry_id=entry_id)
+
+    @callback
+    def _async_load_registered_devices(self, device_registry: dr.DeviceRegistry) -> None:
+        """
+        Track the devices of this entry in the device registry that are not listed now.
+
+        A device the device filter leaves out by its ID or registered name is
+        marked as excluded.
+
+        Args:
+            device_registry: The device registry.
+        """
+        coordinator = self._coordinator
+        entry_id = coordinator.config_entry.entry_id
+        prefix = f"{entry_id}_"
+        for device_entry in dr.async_entries_for_config_entry(device_registry, entry_id):
+            for domain, identifier in device_entry.identifiers:
+                if domain != DOMAIN or not identifier.startswith(prefix) or not identifier[len(prefix) :].isdigit():
+                    continue
+                device_id = int(identifier[len(prefix) :])
+                if device_id in self._known_devices:
+                    continue
+                self._known_devices[device_id] = None
+                if coordinator.device_filter.excludes_registered(device_id, device_entry.name):
+                    self._excluded_devices.add(device_id)
+
+    def _removed_devices(self) -> list[int]:
+        """
+        Return the known devices that were removed from the account or are left out.
+
+        Counts, per known device missing from its family's idu-list, the
+        successful fetches of that family since it went missing.
+        """
+        devices = self._coordinator.data.devices_by_id
+        families = self._coordinator.data.families
+        selected = self._families.selected_family_ids()
+        removed = []
+        for device_id, family_id in self._known_devices.items():
+            if device_id in devices:
+                self._missing_devices.pop(device_id, None)
+                continue
+            if device_id in self._excluded_devices or (
+                selected is not None and family_id is not None and family_id not in selected
+            ):
+                removed.append(device_id)
+                continue
+            status = families.get(family_id) if family_id is not None else None
+            if status is None or status.last_success is None:
+                continue
+            counted_at, polls = self._missing_devices.get(device_id, (None, 0))
+            if status.last_success != counted_at:
+                polls += 1
+                self._missing_devices[device_id] = (status.last_success, polls)
+            if polls >= DEVICE_REMOVAL_POLLS:
+                removed.append(device_id)
+        return removed
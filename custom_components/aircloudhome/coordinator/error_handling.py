@@ -14,15 +14,40 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-
-from custom_components.aircloudhome.const import LOGGER
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import random
+import time
+from typing import TypeVar
+
+from custom_components.aircloudhome.api import (
+    AirCloudHomeApiClientCircuitOpenError,
+    AirCloudHomeApiClientCommunicationError,
+    AirCloudHomeApiClientError,
+    AirCloudHomeApiClientFamilyAccessError,
+)
+from custom_components.aircloudhome.const import (
+    LOGGER,
+    UPDATE_FAILED_RETRY_AFTER,
+    UPDATE_RETRY_BASE_DELAY,
+    UPDATE_RETRY_MAX_DELAY,
+    UPDATE_RETRY_MAX_RETRIES,
+)
+from custom_components.aircloudhome.data import EMPTY_MAPPING, AirCloudHomeFamilyStatus
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+_T = TypeVar("_T")
 
 
 def should_retry_update(exception: Exception, attempt: int) -> bool:
     """
     Determine if an update should be retried based on the error type.
 
+    Only transient communication errors of idempotent requests are retried
+    (see ``AirCloudHomeApiClientCommunicationError.retryable``). Authentication
+    errors, family access errors and failed commands never are.
+
     Args:
         exception: The exception that occurred during update.
         attempt: The current retry attempt number (0-indexed).
@@ -31,21 +56,22 @@ def should_retry_update(exception: Exception, attempt: int) -> bool:
         True if the update should be retried, False otherwise.
 
     Example:
-        >>> from requests.exceptions import Timeout
-        >>> should_retry_update(Timeout(), 0)
+        >>> should_retry_update(AirCloudHomeApiClientCommunicationError("timeout", retryable=True), 0)
         True
         >>> should_retry_update(ValueError(), 0)
         False
     """
-    # Placeholder for retry logic
-    # Consider exception type, attempt count, and error patterns
-    max_retries = 3
-    return attempt < max_retries
+    if attempt >= UPDATE_RETRY_MAX_RETRIES:
+        return False
+    return isinstance(exception, AirCloudHomeApiClientCommunicationError) and exception.retryable
 
 
 def calculate_backoff_delay(attempt: int) -> timedelta:
     """
-    Calculate exponential backoff delay for retry attempts.
+    Calculate a fully jittered exponential backoff delay for retry attempts.
+
+    The delay is drawn uniformly between zero and the exponential backoff
+    (capped), so clients that failed together do not retry in lockstep.
 
     Args:
         attempt: The current retry attempt number (0-indexed).
@@ -54,44 +80,138 @@ def calculate_backoff_delay(attempt: int) -> timedelta:
         The delay to wait before the next retry attempt.
 
     Example:
-        >>> calculate_backoff_delay(0)
-        timedelta(seconds=1)
-        >>> calculate_backoff_delay(2)
-        timedelta(seconds=4)
+        >>> calculate_backoff_delay(0)  # somewhere in [0, 1] seconds
+        timedelta(microseconds=620153)
+        >>> calculate_backoff_delay(2)  # somewhere in [0, 4] seconds
+        timedelta(seconds=2, microseconds=83401)
+    """
+    ceiling = min(UPDATE_RETRY_BASE_DELAY * (2**attempt), UPDATE_RETRY_MAX_DELAY)
+    return timedelta(seconds=random.uniform(0, ceiling))
+
+
+async def async_call_with_retry(call: Callable[[], Awaitable[_T]], *, deadline: float) -> _T:
     """
-    base_delay = 1  # seconds
-    max_delay = 60  # seconds
+    Run an idempotent API read, retrying transient failures with backoff.
 
-    delay = min(base_delay * (2**attempt), max_delay)
-    return timedelta(seconds=delay)
+    Must only wrap GET requests: a retried command could be applied twice.
 
+    Args:
+        call: Starts one attempt of the request.
+        deadline: ``time.monotonic()`` value of the refresh's retry budget.
+            No retry is started if its backoff would end past the deadline.
+
+    Returns:
+        The result of the first successful attempt.
 
-def handle_partial_data(data: dict, error: Exception) -> dict:
+    Raises:
+        AirCloudHomeApiClientError: The last error, once it is not retryable,
+            retries are exhausted or the budget is spent.
     """
-    Handle scenarios where only partial data is available due to errors.
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except AirCloudHomeApiClientCommunicationError as exception:
+            delay = calculate_backoff_delay(attempt).total_seconds()
+            if not should_retry_update(exception, attempt) or time.monotonic() + delay > deadline:
+                raise
+            log_update_failure(exception, attempt, UPDATE_RETRY_MAX_RETRIES + 1)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def handle_partial_data(
+    family_id: int,
+    error: Exception,
+    previous: AirCloudHomeFamilyStatus | None,
+    *,
+    now: datetime,
+    max_age: timedelta,
+) -> AirCloudHomeFamilyStatus:
+    """
+    Decide what to show for a family group whose idu-list could not be fetched.
 
-    This function can decide whether to:
-    - Use cached data
-    - Use partial data with fallback values
-    - Raise the error to make entities unavailable
+    The other families of the refresh are unaffected. This family keeps its
+    last-known devices until they are older than ``max_age``, unless the
+    family group itself is gone, in which case its devices are dropped.
 
     Args:
-        data: The partial data that was successfully retrieved.
-        error: The error that prevented full data retrieval.
+        family_id: The family group that failed.
+        error: The error that prevented fetching its idu-list.
+        previous: The family's status from the previous refresh, if any.
+        now: The time of this refresh.
+        max_age: How long last-known devices may be kept.
 
     Returns:
-        The data to use for this update cycle.
+        The family's status for this refresh.
 
     Example:
-        >>> partial = {"sensor1": 42}
-        >>> handle_partial_data(partial, Exception("sensor2 timeout"))
-        {"sensor1": 42}
+        >>> ok = AirCloudHomeFamilyStatus(devices={10001: device}, last_success=now)
+        >>> handle_partial_data(1, TimeoutError(), ok, now=now, max_age=timedelta(minutes=30)).devices
+        {10001: device}
+    """
+    if previous is None or previous.error is None:
+        LOGGER.warning("Failed to update family group %s: %s", family_id, error)
+    else:
+        LOGGER.debug("Family group %s still failing: %s", family_id, error)
+
+    last_success = previous.last_success if previous is not None else None
+    devices = previous.devices if previous is not None else EMPTY_MAPPING
+    if isinstance(error, AirCloudHomeApiClientFamilyAccessError):
+        devices = EMPTY_MAPPING
+    elif devices and (last_success is None or now - last_success > max_age):
+        LOGGER.warning(
+            "Family group %s has not updated since %s, marking its devices unavailable", family_id, last_success
+        )
+        devices = EMPTY_MAPPING
+    return AirCloudHomeFamilyStatus(devices=devices, last_success=last_success, error=str(error))
+
+
+def build_update_failed(exception: AirCloudHomeApiClientError, update_interval: timedelta | None) -> UpdateFailed:
     """
-    LOGGER.debug("Handling partial data due to: %s", error)
+    Translate an API error that ended a refresh into ``UpdateFailed``.
+
+    Authentication errors are not handled here; they must raise
+    ``ConfigEntryAuthFailed`` instead.
 
-    # Decide on strategy based on error type and available data
-    # This is a placeholder for future implementation
-    return data
+    Args:
+        exception: The API error.
+        update_interval: The coordinator's current update interval.
+
+    Returns:
+        The exception to raise, with ``retry_after`` set when the next
+        attempt should not wait for the full interval.
+    """
+    if isinstance(exception, AirCloudHomeApiClientFamilyAccessError):
+        # The client already dropped its family group cache, so the next
+        # listing skips the group that went away.
+        LOGGER.warning("Family group no longer accessible - %s", exception)
+        return UpdateFailed(
+            translation_domain="aircloudhome",
+            translation_key="update_failed",
+        )
+    if isinstance(exception, AirCloudHomeApiClientCircuitOpenError):
+        # The client is failing fast; poll again once a probe is allowed.
+        LOGGER.debug("Skipping update - %s", exception)
+        return UpdateFailed(
+            translation_domain="aircloudhome",
+            translation_key="api_unavailable",
+            translation_placeholders={"retry_after": str(round(exception.retry_after))},
+            retry_after=exception.retry_after,
+        )
+    LOGGER.error("Error communicating with API - %s", exception)
+    # A transient failure that outlasted the retry budget is tried again
+    # soon rather than after a full (possibly backed-off) interval.
+    retry_after = None
+    if isinstance(exception, AirCloudHomeApiClientCommunicationError) and exception.retryable:
+        retry_after = UPDATE_FAILED_RETRY_AFTER
+        if update_interval is not None:
+            retry_after = min(retry_after, update_interval.total_seconds())
+    return UpdateFailed(
+        translation_domain="aircloudhome",
+        translation_key="update_failed",
+        retry_after=retry_after,
+    )
 
 
 def log_update_failure(exception: Exception, attempt: int, total_attempts: int) -> None:
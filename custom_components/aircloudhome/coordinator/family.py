@@ -0,0 +1,167 @@
+"""
+Per-family coordinator for aircloudhome.
+
+Each family group is polled by its own ``AirCloudHomeFamilyCoordinator`` on
+its own schedule, so a family that needs fresh data every minute does not
+drag along one that is fine with half an hour, and each poll fetches a
+single idu-list.
+
+The parent ``AirCloudHomeDataUpdateCoordinator`` owns the API client, the
+family group listing, pending commands and the combined snapshot. A family
+coordinator hands every result to the parent, which publishes it and
+notifies entities; entities subscribe to their own family's coordinator.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+from typing import TYPE_CHECKING, Any
+
+from custom_components.aircloudhome.api import AirCloudHomeApiClientAuthenticationError, AirCloudHomeApiClientError
+from custom_components.aircloudhome.const import LOGGER, UPDATE_RETRY_BUDGET
+from custom_components.aircloudhome.data import AirCloudHomeFamilyStatus
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .error_handling import async_call_with_retry, build_update_failed
+from .listeners import notify_listeners
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeClimateView, AirCloudHomeConfigEntry, AirCloudHomeDevice
+
+    from .base import AirCloudHomeDataUpdateCoordinator
+    from .polling import AirCloudHomeAdaptivePollingPolicy
+
+
+class AirCloudHomeFamilyCoordinator(DataUpdateCoordinator[AirCloudHomeFamilyStatus]):
+    """
+    Poll the idu-list of one family group.
+
+    Device accessors and commands are delegated to the parent coordinator,
+    so entities use this coordinator like the parent.
+
+    Attributes:
+        config_entry: The config entry for this integration instance.
+        family_id: The family group this coordinator polls.
+        parent: The coordinator owning the client and the combined snapshot.
+        polling: The adaptive polling policy, or None when the fixed update
+            interval is used.
+    """
+
+    config_entry: AirCloudHomeConfigEntry
+    family_id: int
+    parent: AirCloudHomeDataUpdateCoordinator
+    polling: AirCloudHomeAdaptivePollingPolicy | None
+
+    def __init__(
+        self,
+        parent: AirCloudHomeDataUpdateCoordinator,
+        family_id: int,
+        update_interval: timedelta,
+        polling: AirCloudHomeAdaptivePollingPolicy | None,
+    ) -> None:
+        """
+        Initialize the family coordinator.
+
+        Args:
+            parent: The coordinator owning the client and the combined snapshot.
+            family_id: The family group to poll.
+            update_interval: How often to poll the family's idu-list.
+            polling: The family's adaptive polling policy, if enabled.
+        """
+        super().__init__(
+            parent.hass,
+            LOGGER,
+            name=f"{parent.name} family {family_id}",
+            config_entry=parent.config_entry,
+            update_interval=update_interval,
+        )
+        self.family_id = family_id
+        self.parent = parent
+        self.polling = polling
+
+    async def _async_update_data(self) -> AirCloudHomeFamilyStatus:
+        """
+        Fetch the family's idu-list and publish it through the parent.
+
+        Returns:
+            The family's new status.
+
+        Raises:
+            ConfigEntryAuthFailed: If authentication fails, triggers reauthentication.
+            UpdateFailed: If the idu-list could not be fetched. The parent
+                keeps the family's last-known devices for a while.
+        """
+        parent = self.parent
+        sequence = parent.next_sequence()
+        client = self.config_entry.runtime_data.client
+        started = time.monotonic()
+        try:
+            idu_list = await async_call_with_retry(
+                lambda: client.async_get_idu_list(self.family_id),
+                deadline=started + UPDATE_RETRY_BUDGET,
+            )
+        except AirCloudHomeApiClientAuthenticationError as exception:
+            LOGGER.warning("Authentication error - %s", exception)
+            raise ConfigEntryAuthFailed(
+                translation_domain="aircloudhome",
+                translation_key="authentication_failed",
+            ) from exception
+        except AirCloudHomeApiClientError as exception:
+            parent.async_set_family_result(self.family_id, exception, sequence)
+            raise build_update_failed(exception, self.update_interval) from exception
+        finally:
+            parent.family_fetch_durations[self.family_id] = time.monotonic() - started
+
+        status = parent.async_set_family_result(self.family_id, idu_list, sequence)
+        if self.polling is not None:
+            self.update_interval = self.polling.next_interval(status.devices.values())
+        return status
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll on this entry's phase, spread from other entries."""
+        self.parent.scheduler.async_schedule_refresh(self, super()._schedule_refresh, self.parent.poll_jitter)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities through the parent, which diffs devices across families."""
+        self.parent.async_update_listeners()
+
+    @callback
+    def async_notify_listeners(self, changed: set[int] | None) -> int:
+        """
+        Call the listeners of this family's entities.
+
+        Args:
+            changed: The IDs of devices that changed, or None to notify all.
+
+        Returns:
+            The number of listeners skipped because their device did not change.
+        """
+        return notify_listeners(self._listeners.values(), changed)
+
+    @callback
+    def async_note_command(self) -> None:
+        """Poll faster for a while after a command and reschedule the next poll."""
+        if self.polling is not None:
+            self.update_interval = self.polling.note_command()
+            self._schedule_refresh()
+
+    def get_device(self, device_id: int) -> AirCloudHomeDevice | None:
+        """Return the current state of a device; see the parent coordinator."""
+        return self.parent.get_device(device_id)
+
+    def get_climate_view(self, device_id: int) -> AirCloudHomeClimateView | None:
+        """Return the climate values of a device; see the parent coordinator."""
+        return self.parent.get_climate_view(device_id)
+
+    def is_device_stale(self, device_id: int) -> bool:
+        """Return whether a device's state is last-known; see the parent coordinator."""
+        return self.parent.is_device_stale(device_id)
+
+    async def async_send_command(self, device: AirCloudHomeDevice, changes: dict[str, Any]) -> dict[str, Any]:
+        """Send a control command for a device; see the parent coordinator."""
+        return await self.parent.async_send_command(device, changes)
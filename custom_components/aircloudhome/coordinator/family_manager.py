@@ -0,0 +1,180 @@
+"""
+Family coordinator management for aircloudhome.
+
+The main coordinator keeps one ``AirCloudHomeFamilyCoordinator`` (family.py)
+per family group it polls. This module decides which family groups those
+are, from the config entry's family subentries, and creates and stops the
+family coordinators as family groups are listed, selected or removed.
+
+Entities subscribe to their family's coordinator, so a family coordinator is
+kept while a few listings leave its family group out, the same way a device
+is kept while a few idu-lists leave it out. If a family group comes back
+after its coordinator was stopped, the config entry is reloaded so its
+entities subscribe to the new one.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from custom_components.aircloudhome.const import (
+    ADAPTIVE_POLLING_COMMAND_BOOST,
+    ADAPTIVE_POLLING_IDLE_CYCLES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_FAMILY_ID,
+    CONF_MAX_UPDATE_INTERVAL_MINUTES,
+    CONF_MIN_UPDATE_INTERVAL_SECONDS,
+    CONF_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_MAX_UPDATE_INTERVAL_MINUTES,
+    DEFAULT_MIN_UPDATE_INTERVAL_SECONDS,
+    DEVICE_REMOVAL_POLLS,
+    LOGGER,
+    SUBENTRY_TYPE_FAMILY,
+)
+from homeassistant.core import callback
+
+from .family import AirCloudHomeFamilyCoordinator
+from .polling import AirCloudHomeAdaptivePollingPolicy
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigSubentry
+
+    from .base import AirCloudHomeDataUpdateCoordinator
+
+
+class AirCloudHomeFamilyManager:
+    """
+    Keep one family coordinator per polled family group.
+
+    Attributes:
+        coordinators: The coordinator polling each family group, keyed by
+            familyId. The main coordinator exposes this dict as
+            ``family_coordinators``.
+    """
+
+    def __init__(self, coordinator: AirCloudHomeDataUpdateCoordinator) -> None:
+        """
+        Initialize the family manager.
+
+        Args:
+            coordinator: The main coordinator the family coordinators report to.
+        """
+        self._coordinator = coordinator
+        self.coordinators: dict[int, AirCloudHomeFamilyCoordinator] = {}
+        # Listings in a row that left out a family group that is still polled
+        self._omitted: dict[int, int] = {}
+        # Family groups whose coordinator was stopped since the entry was set up
+        self._stopped: set[int] = set()
+
+    def subentries(self) -> dict[int, ConfigSubentry]:
+        """Return the family group subentries of the config entry, keyed by familyId."""
+        return {
+            subentry.data[CONF_FAMILY_ID]: subentry
+            for subentry in self._coordinator.config_entry.subentries.values()
+            if subentry.subentry_type == SUBENTRY_TYPE_FAMILY
+        }
+
+    def selected_family_ids(self) -> set[int] | None:
+        """Return the family groups to poll, or None to poll every listed family group."""
+        return set(subentries) if (subentries := self.subentries()) else None
+
+    def families_to_poll(self, family_ids: list[int]) -> list[int]:
+        """
+        Count the listings that left out each polled family group.
+
+        Called once per listing that lists at least one selected family
+        group. A family group left out of the listing is still polled until
+        ``DEVICE_REMOVAL_POLLS`` listings in a row left it out; one the family
+        selection leaves out is dropped right away.
+
+        Args:
+            family_ids: The selected family groups of the listing, in order.
+
+        Returns:
+            The family groups to poll: the listed ones, followed by those that
+            were left out but are kept for now.
+        """
+        selected = self.selected_family_ids()
+        listed = set(family_ids)
+        kept = []
+        for family_id in self.coordinators:
+            if family_id in listed:
+                self._omitted.pop(family_id, None)
+                continue
+            if selected is not None and family_id not in selected:
+                continue
+            omitted = self._omitted.get(family_id, 0) + 1
+            self._omitted[family_id] = omitted
+            if omitted < DEVICE_REMOVAL_POLLS:
+                LOGGER.debug("Family group %s not listed (%d in a row), still polling it", family_id, omitted)
+                kept.append(family_id)
+        return [*family_ids, *kept]
+
+    async def async_sync(self, family_ids: list[int]) -> None:
+        """
+        Create family coordinators for new family groups and stop those of removed ones.
+
+        If a family group whose coordinator was stopped is polled again, the
+        config entry is reloaded, since its entities are still subscribed to
+        the stopped coordinator.
+
+        Args:
+            family_ids: The family groups to poll, from ``families_to_poll``.
+        """
+        for family_id in self.coordinators.keys() - set(family_ids):
+            LOGGER.debug("Stopping coordinator of removed family group %s", family_id)
+            self._omitted.pop(family_id, None)
+            self._stopped.add(family_id)
+            await self.coordinators.pop(family_id).async_shutdown()
+        for family_id in family_ids:
+            if family_id not in self.coordinators:
+                self.async_create(family_id)
+        if returned := self._stopped.intersection(family_ids):
+            LOGGER.info("Family groups %s are listed again, reloading", ", ".join(map(str, sorted(returned))))
+            self._stopped.clear()
+            entry = self._coordinator.config_entry
+            self._coordinator.hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    @callback
+    def async_create(self, family_id: int) -> AirCloudHomeFamilyCoordinator:
+        """
+        Create the coordinator polling one family group.
+
+        The update interval of the family's subentry applies if set;
+        otherwise the family polls at the main coordinator's interval.
+
+        Args:
+            family_id: The family group to poll.
+        """
+        coordinator = self._coordinator
+        options = coordinator.config_entry.options
+        update_interval = coordinator.update_interval or timedelta()
+        subentry = self.subentries().get(family_id)
+        if subentry is not None and (minutes := subentry.data.get(CONF_UPDATE_INTERVAL_MINUTES)) is not None:
+            update_interval = timedelta(minutes=minutes)
+        polling = None
+        if options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            polling = AirCloudHomeAdaptivePollingPolicy(
+                update_interval,
+                timedelta(
+                    seconds=options.get(CONF_MIN_UPDATE_INTERVAL_SECONDS, DEFAULT_MIN_UPDATE_INTERVAL_SECONDS),
+                ),
+                timedelta(
+                    minutes=options.get(CONF_MAX_UPDATE_INTERVAL_MINUTES, DEFAULT_MAX_UPDATE_INTERVAL_MINUTES),
+                ),
+                idle_cycles=ADAPTIVE_POLLING_IDLE_CYCLES,
+                command_boost=timedelta(seconds=ADAPTIVE_POLLING_COMMAND_BOOST),
+            )
+        family = AirCloudHomeFamilyCoordinator(coordinator, family_id, update_interval, polling)
+        # Listening keeps the family polling even before it has entities, so
+        # units added to an empty family are found.
+        family.async_add_listener(_async_family_updated)
+        self.coordinators[family_id] = family
+        return family
+
+
+@callback
+def _async_family_updated() -> None:
+    """Keep a family coordinator scheduled; updates are dispatched by async_update_listeners."""
@@ -13,10 +13,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any
 
 from custom_components.aircloudhome.const import LOGGER
 
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeDevice
+    from homeassistant.core import CALLBACK_TYPE
+
 
 def create_entity_callback(entity_id: str, callback: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
     """
@@ -80,6 +86,50 @@ def should_notify_entity(old_data: dict, new_data: dict, entity_key: str) -> boo
     return old_data[entity_key] != new_data[entity_key]
 
 
+def changed_fields(old_device: AirCloudHomeDevice, new_device: AirCloudHomeDevice) -> set[str]:
+    """
+    Return the fields that differ between two versions of a device.
+
+    Args:
+        old_device: The state entities were last notified about.
+        new_device: The current state.
+
+    Returns:
+        The names of changed fields.
+
+    Example:
+        >>> changed_fields(device, replace(device, room_temperature=26.0))
+        {"room_temperature"}
+    """
+    names = [field.name for field in fields(old_device)]
+    old_data = {name: getattr(old_device, name) for name in names}
+    new_data = {name: getattr(new_device, name) for name in names}
+    return {name for name in names if should_notify_entity(old_data, new_data, name)}
+
+
+def notify_listeners(listeners: Iterable[tuple[CALLBACK_TYPE, Any]], changed: set[int] | None) -> int:
+    """
+    Call coordinator listeners whose device changed.
+
+    Listeners registered with a device ID as context are only called when
+    that device is in ``changed``; listeners without a context always are.
+
+    Args:
+        listeners: The ``(callback, context)`` pairs of a coordinator.
+        changed: The IDs of devices that changed, or None to call every listener.
+
+    Returns:
+        The number of listeners that were skipped.
+    """
+    skipped = 0
+    for update_callback, context in list(listeners):
+        if changed is None or context is None or context in changed:
+            update_callback()
+        else:
+            skipped += 1
+    return skipped
+
+
 def track_update_performance(update_duration: float) -> None:
     """
     Track and log coordinator update performance metrics.
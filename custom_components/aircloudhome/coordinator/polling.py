@@ -0,0 +1,127 @@
+"""
+Adaptive polling for the coordinator.
+
+A single fixed update interval is either too slow right after a command or
+while rooms are heating up / cooling down, or wasteful overnight when every
+unit is off. The policy in this module picks the next interval from recent
+device activity, always staying within configurable bounds.
+
+Rules, in order:
+- Shortly after a command, or while a running unit's room temperature is
+  changing → minimum interval
+- Every unit off, or nothing changed for several cycles → back off
+  (double the interval up to the maximum)
+- Otherwise → the configured update interval
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import timedelta
+import time
+from typing import TYPE_CHECKING
+
+from custom_components.aircloudhome.const import LOGGER
+from custom_components.aircloudhome.data import Power
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeDevice
+
+
+def _activity(device: AirCloudHomeDevice) -> tuple[object, ...]:
+    """Return the fields whose change counts as device activity."""
+    return (
+        device.online,
+        device.power,
+        device.mode,
+        device.idu_temperature,
+        device.room_temperature,
+        device.fan_speed,
+        device.fan_swing,
+        device.humidity,
+    )
+
+
+class AirCloudHomeAdaptivePollingPolicy:
+    """Choose the coordinator's next update interval from device activity."""
+
+    def __init__(
+        self,
+        base: timedelta,
+        minimum: timedelta,
+        maximum: timedelta,
+        *,
+        idle_cycles: int,
+        command_boost: timedelta,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            base: The configured update interval, used while units are active.
+            minimum: Shortest allowed interval.
+            maximum: Longest allowed interval.
+            idle_cycles: Unchanged refreshes after which polling backs off.
+            command_boost: How long after a command the minimum is used.
+        """
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self._base = self._clamp(base)
+        self._idle_cycles = idle_cycles
+        self._command_boost = command_boost.total_seconds()
+        self._boost_until = 0.0
+        self._current = self._base
+        self._unchanged_cycles = 0
+        self._devices: dict[int, AirCloudHomeDevice] | None = None
+
+    def note_command(self) -> timedelta:
+        """
+        Record that a command was just sent.
+
+        Returns:
+            The interval to use until the next refresh.
+        """
+        self._boost_until = time.monotonic() + self._command_boost
+        self._current = self.minimum
+        return self._current
+
+    def next_interval(self, devices: Iterable[AirCloudHomeDevice]) -> timedelta:
+        """
+        Return the interval until the next refresh after a successful one.
+
+        Args:
+            devices: The devices from the refresh that just finished.
+        """
+        previous = self._devices
+        current = {device.id: device for device in devices}
+        self._devices = current
+
+        unchanged = previous is not None and (
+            current.keys() == previous.keys()
+            and all(
+                previous[device.id] is device or _activity(device) == _activity(previous[device.id])
+                for device in current.values()
+            )
+        )
+        self._unchanged_cycles = self._unchanged_cycles + 1 if unchanged else 0
+        running = [device for device in current.values() if device.power is Power.ON]
+        temperature_changing = previous is not None and any(
+            device.id in previous and previous[device.id].room_temperature != device.room_temperature
+            for device in running
+        )
+
+        if time.monotonic() < self._boost_until or temperature_changing:
+            interval = self.minimum
+        elif not running or self._unchanged_cycles >= self._idle_cycles:
+            interval = self._clamp(max(self._current, self._base) * 2)
+        else:
+            interval = self._base
+
+        if interval != self._current:
+            LOGGER.debug("Adaptive polling: next refresh in %s", interval)
+        self._current = interval
+        return interval
+
+    def _clamp(self, interval: timedelta) -> timedelta:
+        """Keep an interval within the configured bounds."""
+        return max(self.minimum, min(interval, self.maximum))
@@ -0,0 +1,127 @@
+"""
+Poll scheduling across config entries.
+
+Config entries set up together at startup with the same update interval
+would otherwise poll in lockstep, sending every account's requests in one
+burst. The integration keeps one ``AirCloudHomePollScheduler`` for all
+entries. It gives each loaded entry a deterministic phase within the update
+interval, so N entries poll 1/N of an interval apart, and optionally adds
+random jitter to every poll.
+
+Phases follow the order of the entry IDs, so the same set of entries always
+gets the same phases. Adding or removing an entry re-spreads the others from
+their next poll on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import math
+import random
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+
+class AirCloudHomePollScheduler:
+    """Spread the polls of all config entries evenly over the update interval."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler without any entries."""
+        self._entry_ids: list[str] = []
+
+    @callback
+    def async_register(self, entry_id: str) -> CALLBACK_TYPE:
+        """
+        Give a config entry a phase.
+
+        Args:
+            entry_id: The config entry being set up.
+
+        Returns:
+            A function that releases the entry's phase, for ``entry.async_on_unload``.
+        """
+        self._entry_ids = sorted({*self._entry_ids, entry_id})
+
+        @callback
+        def _async_unregister() -> None:
+            self._entry_ids = [other for other in self._entry_ids if other != entry_id]
+
+        return _async_unregister
+
+    def phase(self, entry_id: str) -> float:
+        """
+        Return the share of the update interval an entry's polls are offset by.
+
+        Args:
+            entry_id: A config entry.
+
+        Returns:
+            The entry's position among the registered entries divided by
+            their number, in [0, 1). 0 if the entry is not registered.
+        """
+        if entry_id not in self._entry_ids:
+            return 0.0
+        return self._entry_ids.index(entry_id) / len(self._entry_ids)
+
+    def next_delay(self, entry_id: str, interval: timedelta, jitter: float = 0.0) -> timedelta:
+        """
+        Return how long to wait until an entry's next poll.
+
+        The poll is placed on the next point of the entry's grid, the
+        points ``interval`` apart and offset by the entry's phase, that is
+        at least half an interval away, so the delay stays between half
+        and one and a half intervals before jitter.
+
+        Args:
+            entry_id: The config entry polling.
+            interval: The poll's nominal interval.
+            jitter: Up to this share of the interval is randomly added or
+                subtracted.
+
+        Returns:
+            The delay until the next poll.
+
+        Example:
+            >>> scheduler.next_delay("entry_b", timedelta(minutes=5))  # 2 entries
+            datetime.timedelta(seconds=271, microseconds=400000)
+        """
+        period = interval.total_seconds()
+        if period <= 0 or entry_id not in self._entry_ids:
+            return interval
+        offset = self.phase(entry_id) * period
+        now = time.monotonic()
+        slot = offset + math.ceil((now + period / 2 - offset) / period) * period
+        return timedelta(seconds=slot - now + random.uniform(-jitter, jitter) * period)
+
+    @callback
+    def async_schedule_refresh(
+        self,
+        coordinator: DataUpdateCoordinator[Any],
+        schedule_refresh: Callable[[], None],
+        jitter: float,
+    ) -> None:
+        """
+        Schedule a coordinator's next refresh on its entry's phase.
+
+        The coordinator's ``update_interval`` stays its nominal interval; it
+        only holds the phased delay while ``schedule_refresh`` runs.
+
+        Args:
+            coordinator: The coordinator to schedule.
+            schedule_refresh: The coordinator's own ``_schedule_refresh``.
+            jitter: Up to this share of the interval is randomly added or
+                subtracted.
+        """
+        interval = coordinator.update_interval
+        if interval is None or coordinator.config_entry is None:
+            schedule_refresh()
+            return
+        coordinator.update_interval = self.next_delay(coordinator.config_entry.entry_id, interval, jitter)
+        try:
+            schedule_refresh()
+        finally:
+            coordinator.update_interval = interval
@@ -0,0 +1,157 @@
+"""
+Snapshot persistence for aircloudhome.
+
+The last successful coordinator snapshot is saved in a Home Assistant
+``Store`` keyed by config entry. At startup, platforms are set up from it
+right away, so entities are created without any network round-trip and the
+first live refresh runs in the background instead of blocking setup.
+
+For more information on storage:
+https://developers.home-assistant.io/docs/api/storage
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from custom_components.aircloudhome.const import DOMAIN, LOGGER, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+from custom_components.aircloudhome.data import AirCloudHomeDevice, AirCloudHomeFamilyStatus, AirCloudHomeSnapshot
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .data_processing import cache_computed_values, validate_api_response
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .base import AirCloudHomeDataUpdateCoordinator
+
+
+def serialize_snapshot(snapshot: AirCloudHomeSnapshot) -> dict[str, Any]:
+    """
+    Convert a snapshot into JSON-serializable storage data.
+
+    Args:
+        snapshot: The snapshot to store.
+
+    Returns:
+        The family groups in order, each with its devices as idu-list records.
+    """
+    return {
+        "families": [
+            {
+                "family_id": family_id,
+                "last_success": status.last_success.isoformat() if status.last_success else None,
+                "devices": [device.as_record() for device in status.devices.values()],
+            }
+            for family_id, status in snapshot.families.items()
+        ],
+    }
+
+
+def deserialize_snapshot(data: dict[str, Any]) -> AirCloudHomeSnapshot:
+    """
+    Rebuild a snapshot from storage data.
+
+    Invalid device records are skipped, like records of a live idu-list.
+
+    Args:
+        data: Storage data created by ``serialize_snapshot``.
+
+    Returns:
+        A snapshot marked as restored.
+    """
+    families: dict[int, AirCloudHomeFamilyStatus] = {}
+    for family in data.get("families", []):
+        family_id = family["family_id"]
+        devices = MappingProxyType(
+            {
+                record["id"]: AirCloudHomeDevice.from_api(record, family_id)
+                for record in family.get("devices", [])
+                if validate_api_response(record)
+            }
+        )
+        last_success = dt_util.parse_datetime(family["last_success"]) if family.get("last_success") else None
+        families[family_id] = AirCloudHomeFamilyStatus(devices=devices, last_success=last_success)
+    devices_by_id = MappingProxyType(
+        {device_id: device for status in families.values() for device_id, device in status.devices.items()}
+    )
+    return AirCloudHomeSnapshot(
+        devices_by_id=devices_by_id,
+        families=MappingProxyType(families),
+        climate_views=cache_computed_values(devices_by_id, None),
+        restored=True,
+    )
+
+
+class AirCloudHomeSnapshotStore:
+    """Persist the last successful coordinator snapshot for one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """
+        Initialize the snapshot store.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry the snapshot belongs to.
+
+        """
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            f"{DOMAIN}.snapshot.{entry_id}",
+            atomic_writes=True,
+        )
+
+    async def async_load(self) -> AirCloudHomeSnapshot | None:
+        """
+        Load the stored snapshot.
+
+        Returns:
+            The restored snapshot, or None if nothing usable was stored.
+
+        """
+        if (data := await self._store.async_load()) is None:
+            return None
+        try:
+            snapshot = deserialize_snapshot(data)
+        except (KeyError, TypeError, ValueError) as exception:
+            LOGGER.warning("Ignoring invalid stored snapshot - %s", exception)
+            return None
+        LOGGER.debug("Restored snapshot with %d devices", len(snapshot.devices_by_id))
+        return snapshot
+
+    @callback
+    def async_track(self, coordinator: AirCloudHomeDataUpdateCoordinator) -> Callable[[], None]:
+        """
+        Save the coordinator's data after every successful live refresh.
+
+        Args:
+            coordinator: The coordinator whose snapshots should be persisted.
+
+        Returns:
+            A function that stops tracking, for ``entry.async_on_unload``.
+
+        """
+        saved: AirCloudHomeSnapshot | None = None
+
+        @callback
+        def _async_schedule_save() -> None:
+            nonlocal saved
+            snapshot = coordinator.data
+            if not coordinator.last_update_success or snapshot is None or snapshot.restored or snapshot is saved:
+                return
+            saved = snapshot
+            self._store.async_delay_save(lambda: serialize_snapshot(snapshot), SNAPSHOT_SAVE_DELAY)
+
+        # Save the data of a blocking first refresh as well
+        _async_schedule_save()
+        return coordinator.async_add_listener(_async_schedule_save)
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
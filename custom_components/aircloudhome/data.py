@@ -4,26 +4,61 @@
 This module defines the runtime data structure attached to each config entry.
 Access pattern: entry.runtime_data.client / entry.runtime_data.coordinator
 
+Data shared by all config entries lives in hass.data[DOMAIN_DATA].
+
 The AirCloudHomeConfigEntry type alias is used throughout the integration
 for type-safe access to the config entry's runtime data.
+
+It also defines the coordinator data: AirCloudHomeSnapshot, an immutable
+snapshot of every AC unit (AirCloudHomeDevice), its Home Assistant climate
+values (AirCloudHomeClimateView) and the refresh status of each family group
+(AirCloudHomeFamilyStatus). Objects that did not change between two
+snapshots are shared, so a change can be detected with an identity check.
+
+Family groups listed for the account are AirCloudHomeFamilyGroup.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
+from enum import StrEnum
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Self
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
-    from .api import AirCloudHomeApiClient
-    from .coordinator import AirCloudHomeDataUpdateCoordinator
+    from .api import AirCloudHomeApiClient, AirCloudHomeRateLimiter
+    from .coordinator import AirCloudHomeDataUpdateCoordinator, AirCloudHomePollScheduler
 
 
 type AirCloudHomeConfigEntry = ConfigEntry[AirCloudHomeData]
 
 
+@dataclass
+class AirCloudHomeDomainData:
+    """Integration-wide data shared by all aircloudhome config entries.
+
+    Stored as hass.data[DOMAIN] when the integration is set up.
+    Provides the poll scheduler and the API rate limiter.
+    """
+
+    rate_limiter: AirCloudHomeRateLimiter
+    scheduler: AirCloudHomePollScheduler
+
+
+DOMAIN_DATA: HassKey[AirCloudHomeDomainData] = HassKey(DOMAIN)
+
+
 @dataclass
 class AirCloudHomeData:
     """Runtime data for aircloudhome config entries.
@@ -35,3 +70,320 @@ class AirCloudHomeData:
     client: AirCloudHomeApiClient
     coordinator: AirCloudHomeDataUpdateCoordinator
     integration: Integration
+
+
+class Power(StrEnum):
+    """Power state reported and accepted by the API."""
+
+    ON = "ON"
+    OFF = "OFF"
+
+
+class OperationMode(StrEnum):
+    """Operating mode reported and accepted by the API."""
+
+    HEATING = "HEATING"
+    COOLING = "COOLING"
+    FAN = "FAN"
+    DRY = "DRY"
+    DRY_COOL = "DRY_COOL"
+    AUTO = "AUTO"
+    UNKNOWN = "UNKNOWN"
+
+
+class FanSpeed(StrEnum):
+    """Fan speed reported and accepted by the API."""
+
+    AUTO = "AUTO"
+    LV1 = "LV1"
+    LV2 = "LV2"
+    LV3 = "LV3"
+    LV4 = "LV4"
+    LV5 = "LV5"
+
+
+class FanSwing(StrEnum):
+    """Fan swing direction reported and accepted by the API."""
+
+    AUTO = "AUTO"
+    OFF = "OFF"
+    VERTICAL = "VERTICAL"
+    HORIZONTAL = "HORIZONTAL"
+    BOTH = "BOTH"
+
+
+def _enum_or_default[E: StrEnum](enum: type[E], value: Any, default: E) -> E:
+    """Return the enum member for an API value, or a default for unknown values."""
+    try:
+        return enum(value)
+    except ValueError:
+        return default
+
+
+def _float_or_none(value: Any) -> float | None:
+    """Return a numeric API value as float, or None."""
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _int_or_none(value: Any) -> int | None:
+    """Return a numeric API value as a rounded int, or None."""
+    return round(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _str_or_none(value: Any) -> str | None:
+    """Return a string API value, interned since it repeats across devices, or None."""
+    return sys.intern(value) if isinstance(value, str) else None
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomeDevice:
+    """
+    Parsed state of one AC unit.
+
+    Built once per refresh from an idu-list record, keeping only the fields
+    the integration uses. Enum fields hold shared enum members, so comparing
+    and reading them is cheap. Instances are immutable; pending commands
+    are overlaid as a new instance created with ``with_changes``.
+
+    The ``api_*`` fields keep the control values exactly as reported (None
+    if missing), so commands echo them back instead of the enum fallbacks.
+    """
+
+    id: int
+    family_id: int
+    name: str | None
+    online: bool
+    power: Power
+    mode: OperationMode
+    fan_speed: FanSpeed
+    fan_swing: FanSwing
+    idu_temperature: float | None
+    room_temperature: float | None
+    humidity: int | None
+    has_humidity: bool
+    model: str | None
+    serial_number: str | None
+    vendor_thing_id: str | None
+    rac_type_id: int | None
+    updated_at: int | None
+    last_online_updated_at: int | None
+    api_power: str | None = None
+    api_mode: str | None = None
+    api_fan_speed: str | None = None
+    api_fan_swing: str | None = None
+
+    @classmethod
+    def from_api(cls, record: Mapping[str, Any], family_id: int) -> Self:
+        """
+        Parse an idu-list record.
+
+        Args:
+            record: One device record from the idu-list.
+            family_id: The family group the record was listed in.
+
+        Returns:
+            The parsed device. Unknown enum values fall back to
+            ``UNKNOWN`` (mode), ``OFF`` (power, swing) or ``AUTO`` (fan speed).
+        """
+        return cls(
+            id=record["id"],
+            family_id=family_id,
+            name=record.get("name"),
+            online=record.get("online") is True,
+            power=_enum_or_default(Power, record.get("power"), Power.OFF),
+            mode=_enum_or_default(OperationMode, record.get("mode"), OperationMode.UNKNOWN),
+            fan_speed=_enum_or_default(FanSpeed, record.get("fanSpeed"), FanSpeed.AUTO),
+            fan_swing=_enum_or_default(FanSwing, record.get("fanSwing"), FanSwing.OFF),
+            idu_temperature=_float_or_none(record.get("iduTemperature")),
+            room_temperature=_float_or_none(record.get("roomTemperature")),
+            humidity=_int_or_none(record.get("humidity")),
+            # Units that report the key support a humidity setpoint, even while it is null
+            has_humidity="humidity" in record,
+            model=_str_or_none(record.get("model")),
+            serial_number=_str_or_none(record.get("serialNumber")),
+            vendor_thing_id=record.get("vendorThingId"),
+            rac_type_id=_int_or_none(record.get("racTypeId")),
+            updated_at=_int_or_none(record.get("updatedAt")),
+            last_online_updated_at=_int_or_none(record.get("lastOnlineUpdatedAt")),
+            api_power=_str_or_none(record.get("power")),
+            api_mode=_str_or_none(record.get("mode")),
+            api_fan_speed=_str_or_none(record.get("fanSpeed")),
+            api_fan_swing=_str_or_none(record.get("fanSwing")),
+        )
+
+    def as_record(self) -> dict[str, Any]:
+        """
+        Return the device as an idu-list record, e.g. for storage.
+
+        ``from_api`` parses the result back into an equal device; ``humidity``
+        is left out for units that do not report it.
+        """
+        record = {
+            "id": self.id,
+            "name": self.name,
+            "online": self.online,
+            "power": self.api_power,
+            "mode": self.api_mode,
+            "fanSpeed": self.api_fan_speed,
+            "fanSwing": self.api_fan_swing,
+            "iduTemperature": self.idu_temperature,
+            "roomTemperature": self.room_temperature,
+            "humidity": self.humidity,
+            "model": self.model,
+            "serialNumber": self.serial_number,
+            "vendorThingId": self.vendor_thing_id,
+            "racTypeId": self.rac_type_id,
+            "updatedAt": self.updated_at,
+            "lastOnlineUpdatedAt": self.last_online_updated_at,
+        }
+        if not self.has_humidity:
+            del record["humidity"]
+        return record
+
+    def with_changes(self, changes: Mapping[str, Any]) -> Self:
+        """
+        Return a copy with commanded fields applied.
+
+        Args:
+            changes: The fields to change, keyed by API field name
+                (``power``, ``mode``, ``fanSpeed``, ``fanSwing``,
+                ``iduTemperature``, ``humidity``).
+        """
+        updates: dict[str, Any] = {}
+        if "power" in changes:
+            updates["power"] = Power(changes["power"])
+            updates["api_power"] = updates["power"].value
+        if "mode" in changes:
+            updates["mode"] = OperationMode(changes["mode"])
+            updates["api_mode"] = updates["mode"].value
+        if "fanSpeed" in changes:
+            updates["fan_speed"] = FanSpeed(changes["fanSpeed"])
+            updates["api_fan_speed"] = updates["fan_speed"].value
+        if "fanSwing" in changes:
+            updates["fan_swing"] = FanSwing(changes["fanSwing"])
+            updates["api_fan_swing"] = updates["fan_swing"].value
+        if "iduTemperature" in changes:
+            updates["idu_temperature"] = _float_or_none(changes["iduTemperature"])
+        if "humidity" in changes:
+            updates["humidity"] = _int_or_none(changes["humidity"])
+        return replace(self, **updates)
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomeClimateView:
+    """
+    Home Assistant climate values of one AC unit.
+
+    Derived from an AirCloudHomeDevice once per refresh (or pending
+    command update), so climate properties are plain attribute reads.
+    """
+
+    hvac_mode: HVACMode
+    fan_mode: str
+    swing_mode: str
+    preset_mode: str
+
+
+# Shared read-only empty mapping for snapshots without devices
+EMPTY_MAPPING: Mapping[Any, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomeFamilyGroup:
+    """
+    A family group listed for the account.
+
+    Attributes:
+        family_id: The familyId used in idu-list requests.
+        name: The family's name, or its ID if it has none.
+        role: The user's role in the family (e.g. ``OWNER``), if reported.
+    """
+
+    family_id: int
+    name: str
+    role: str | None
+
+    @classmethod
+    def from_api(cls, record: Mapping[str, Any]) -> Self:
+        """
+        Parse a family group record.
+
+        Args:
+            record: One family group record with a familyId.
+
+        Returns:
+            The parsed family group.
+        """
+        role = record.get("role")
+        return cls(
+            family_id=record["familyId"],
+            name=_str_or_none(record.get("familyName")) or str(record["familyId"]),
+            role=_str_or_none(role.get("name")) if isinstance(role, Mapping) else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomeFamilyStatus:
+    """
+    Refresh status of one family group.
+
+    Attributes:
+        devices: The family's devices by ID: fresh, or last-known while failing.
+        last_success: When the family's idu-list was last fetched successfully.
+        error: Why the latest fetch failed, or None if it succeeded.
+    """
+
+    devices: Mapping[int, AirCloudHomeDevice]
+    last_success: datetime | None
+    error: str | None = None
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the devices are last-known rather than fresh."""
+        return self.error is not None
+
+
+@dataclass(frozen=True, slots=True)
+class AirCloudHomeSnapshot:
+    """
+    Immutable coordinator data.
+
+    A new snapshot is created for every refresh and every command
+    confirmation; existing snapshots are never modified. It holds the state
+    the API reported; pending commands are overlaid by the coordinator.
+    Devices, views and family statuses that did not change are the same
+    objects as in the previous snapshot.
+
+    Attributes:
+        devices_by_id: Every device, ordered by family group, then by
+            idu-list order.
+        families: The refresh status of every family group, in family-group
+            order. Each holds that family's devices by ID.
+        climate_views: The Home Assistant climate values of every device.
+        restored: Whether the snapshot was loaded from storage at startup
+            and no live refresh has succeeded since.
+    """
+
+    devices_by_id: Mapping[int, AirCloudHomeDevice] = EMPTY_MAPPING
+    families: Mapping[int, AirCloudHomeFamilyStatus] = EMPTY_MAPPING
+    climate_views: Mapping[int, AirCloudHomeClimateView] = EMPTY_MAPPING
+    restored: bool = False
+
+    def with_device(self, device: AirCloudHomeDevice, view: AirCloudHomeClimateView) -> Self:
+        """
+        Return a snapshot with one listed device replaced.
+
+        Args:
+            device: The new state of a device in this snapshot.
+            view: The device's Home Assistant climate values.
+        """
+        families = self.families
+        if (status := families.get(device.family_id)) is not None and device.id in status.devices:
+            family_devices = MappingProxyType({**status.devices, device.id: device})
+            families = MappingProxyType({**families, device.family_id: replace(status, devices=family_devices)})
+        return replace(
+            self,
+            devices_by_id=MappingProxyType({**self.devices_by_id, device.id: device}),
+            families=families,
+            climate_views=MappingProxyType({**self.climate_views, device.id: view}),
+        )
@@ -11,10 +11,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from custom_components.aircloudhome.const import ATTRIBUTION
-from custom_components.aircloudhome.coordinator import AirCloudHomeDataUpdateCoordinator
+from custom_components.aircloudhome.coordinator import AirCloudHomeFamilyCoordinator
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -22,7 +22,7 @@
     from homeassistant.helpers.entity import EntityDescription
 
 
-class AirCloudHomeEntity(CoordinatorEntity[AirCloudHomeDataUpdateCoordinator]):
+class AirCloudHomeEntity(CoordinatorEntity[AirCloudHomeFamilyCoordinator]):
     """
     Base entity class for aircloudhome.
 
@@ -42,20 +42,23 @@ class AirCloudHomeEntity(CoordinatorEntity[AirCloudHomeDataUpdateCoordinator]):
 
     def __init__(
         self,
-        coordinator: AirCloudHomeDataUpdateCoordinator,
+        coordinator: AirCloudHomeFamilyCoordinator,
         entity_description: EntityDescription,
         device_id: str | None = None,
+        context: Any = None,
     ) -> None:
         """
         Initialize the base entity.
 
         Args:
-            coordinator: The data update coordinator for this entity.
+            coordinator: The coordinator of the family group the entity's device belongs to.
             entity_description: The entity description defining characteristics.
             device_id: Optional device ID for multi-device support (e.g., AC unit ID).
+            context: Coordinator listener context. Entities of one AC unit pass
+                its API device ID so they are only notified when it changes.
 
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context)
         self.entity_description = entity_description
 
         # Generate unique ID with optional device ID
@@ -68,21 +71,30 @@ def _get_device_info(self) -> DeviceInfo:
         """
         Get device information for this entity.
 
-        Override this method in subclasses to customize device info per entity type.
+        Entities of an AC unit (those with its API device ID as context) get
+        the unit's device, described from its device model. Other entities
+        get a device for the config entry. Override this method in
+        subclasses to customize device info per entity type.
 
         Returns:
             DeviceInfo for the device associated with this entity.
         """
+        entry = self.coordinator.config_entry
+        if (
+            self.coordinator_context is not None
+            and (device := self.coordinator.get_device(self.coordinator_context)) is not None
+        ):
+            return DeviceInfo(
+                identifiers={(entry.domain, f"{entry.entry_id}_{device.id}")},
+                name=device.name or f"AC Unit {device.id}",
+                manufacturer=device.model,
+                serial_number=device.serial_number,
+                hw_version=device.vendor_thing_id,
+            )
         return DeviceInfo(
-            identifiers={
-                (
-                    self.coordinator.config_entry.domain,
-                    self.coordinator.config_entry.entry_id,
-                ),
-            },
-            name=self.coordinator.config_entry.title,
-            manufacturer=self.coordinator.config_entry.domain,
-            model=self.coordinator.data.get("model", "Unknown"),
+            identifiers={(entry.domain, entry.entry_id)},
+            name=entry.title,
+            manufacturer=entry.domain,
         )
 
     @property
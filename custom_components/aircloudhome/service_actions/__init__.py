@@ -0,0 +1,93 @@
+"""
+Service actions for aircloudhome.
+
+Service actions are registered once per integration in ``async_setup()`` and
+operate on the loaded config entries of this domain.
+
+Available service actions:
+- rediscover_devices: Re-list family groups and refresh devices immediately
+
+For more information:
+https://developers.home-assistant.io/docs/dev_101_services/
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from custom_components.aircloudhome.const import DOMAIN, SERVICE_REDISCOVER_DEVICES
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+if TYPE_CHECKING:
+    from custom_components.aircloudhome.data import AirCloudHomeConfigEntry
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+REDISCOVER_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    },
+)
+
+
+def _get_loaded_entries(hass: HomeAssistant, call: ServiceCall) -> list[AirCloudHomeConfigEntry]:
+    """
+    Resolve the config entries a service call applies to.
+
+    Args:
+        hass: The Home Assistant instance.
+        call: The service call, optionally naming a single config entry.
+
+    Returns:
+        The loaded config entries to act on.
+
+    Raises:
+        ServiceValidationError: If the requested config entry is not loaded.
+
+    """
+    entries: list[AirCloudHomeConfigEntry] = [
+        entry for entry in hass.config_entries.async_entries(DOMAIN) if entry.state is ConfigEntryState.LOADED
+    ]
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is None:
+        return entries
+
+    selected = [entry for entry in entries if entry.entry_id == entry_id]
+    if not selected:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="config_entry_not_loaded",
+            translation_placeholders={"config_entry_id": entry_id},
+        )
+    return selected
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """
+    Register the integration's service actions.
+
+    Args:
+        hass: The Home Assistant instance.
+
+    """
+    if hass.services.has_service(DOMAIN, SERVICE_REDISCOVER_DEVICES):
+        return
+
+    async def async_rediscover_devices(call: ServiceCall) -> None:
+        """Invalidate cached family groups and refresh the selected entries."""
+        for entry in _get_loaded_entries(hass, call):
+            await entry.runtime_data.coordinator.async_rediscover()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REDISCOVER_DEVICES,
+        async_rediscover_devices,
+        schema=REDISCOVER_DEVICES_SCHEMA,
+    )
+
+
+__all__ = ["async_setup_services"]
@@ -0,0 +1,60 @@
+"""Tests for the aircloudhome API rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.aircloudhome.api import AirCloudHomeRateLimiter, RequestKind
+
+
+@pytest.mark.unit
+async def test_waiting_reads_do_not_hold_back_commands() -> None:
+    """A command is sent right away while reads wait for the read limit."""
+    limiter = AirCloudHomeRateLimiter()
+    unregister = limiter.register("entry", {RequestKind.READ: 6, RequestKind.WRITE: 6})
+    # Each bucket holds a single token at 6 per minute; use up the read token
+    await limiter.async_acquire(RequestKind.READ)
+    reads = [asyncio.ensure_future(limiter.async_acquire(RequestKind.READ)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(limiter.async_acquire(RequestKind.WRITE), 0.1)
+    assert not any(read.done() for read in reads)
+
+    for read in reads:
+        read.cancel()
+    await asyncio.gather(*reads, return_exceptions=True)
+    unregister()
+
+
+@pytest.mark.unit
+async def test_waiting_requests_are_served_in_arrival_order() -> None:
+    """Requests of one kind get tokens in the order they started waiting."""
+    limiter = AirCloudHomeRateLimiter()
+    limiter.register("entry", {RequestKind.READ: 600})
+    # 600 per minute allows a burst of 100, then a token every 0.1 s
+    for _ in range(100):
+        await limiter.async_acquire(RequestKind.READ)
+    order: list[int] = []
+
+    async def acquire(number: int) -> None:
+        await limiter.async_acquire(RequestKind.READ)
+        order.append(number)
+
+    await asyncio.gather(*(acquire(number) for number in range(3)))
+    assert order == [0, 1, 2]
+
+
+@pytest.mark.unit
+async def test_lowest_registered_limit_applies() -> None:
+    """The lowest limit of any registered entry applies, and 0 means no limit."""
+    limiter = AirCloudHomeRateLimiter()
+    unregister = limiter.register("first", {RequestKind.READ: 6})
+    limiter.register("second", {RequestKind.READ: 0})
+    await limiter.async_acquire(RequestKind.READ)
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(limiter.async_acquire(RequestKind.READ), 0.1)
+
+    unregister()
+    await asyncio.wait_for(limiter.async_acquire(RequestKind.READ), 0.1)
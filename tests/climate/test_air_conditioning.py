@@ -0,0 +1,45 @@
+"""Tests for the aircloudhome climate entity."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.climate import ATTR_TEMPERATURE, DOMAIN as CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+
+@pytest.mark.integration
+async def test_command_echoes_unrecognized_values(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api_client: MagicMock,
+    device_record: Callable[..., dict[str, Any]],
+) -> None:
+    """Control values the integration does not recognize are sent back as reported."""
+    record = device_record(1, mode="SUPER_COOL", fanSpeed="LV9", fanSwing="DIAGONAL")
+    del record["power"]
+    mock_api_client.async_get_idu_list.return_value = [record]
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = hass.states.async_entity_ids(CLIMATE_DOMAIN)[0]
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: 21},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    fields = mock_api_client.async_control_device.await_args.kwargs
+    assert fields["power"] == "ON"
+    assert fields["mode"] == "SUPER_COOL"
+    assert fields["fan_speed"] == "LV9"
+    assert fields["fan_swing"] == "DIAGONAL"
+    assert fields["idu_temperature"] == 21
@@ -0,0 +1,78 @@
+"""Shared fixtures for aircloudhome tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.aircloudhome.const import DOMAIN
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+FAMILY_GROUPS: list[dict[str, Any]] = [{"familyId": 1, "familyName": "Home", "role": {"name": "OWNER"}}]
+
+
+def _device_record(device_id: int, **fields: Any) -> dict[str, Any]:
+    """Return an idu-list record for a device, with fields overridden."""
+    record: dict[str, Any] = {
+        "id": device_id,
+        "name": f"AC {device_id}",
+        "online": True,
+        "power": "ON",
+        "mode": "COOLING",
+        "fanSpeed": "AUTO",
+        "fanSwing": "OFF",
+        "iduTemperature": 24.0,
+        "roomTemperature": 26.0,
+        "model": "HITACHI",
+        "serialNumber": f"SN{device_id}",
+        "vendorThingId": f"VT{device_id}",
+        "racTypeId": 6,
+        "updatedAt": 1000,
+        "lastOnlineUpdatedAt": 1000,
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading the custom integration in every test."""
+
+
+@pytest.fixture
+def device_record() -> Callable[..., dict[str, Any]]:
+    """Return a factory for idu-list device records."""
+    return _device_record
+
+
+@pytest.fixture
+def mock_api_client() -> Generator[MagicMock]:
+    """Return a mocked API client listing one family group with one device."""
+    with patch("custom_components.aircloudhome.AirCloudHomeApiClient", autospec=True) as client_class:
+        client = client_class.return_value
+        client.async_get_family_groups = AsyncMock(return_value=FAMILY_GROUPS)
+        client.async_get_idu_list = AsyncMock(return_value=[_device_record(1)])
+        client.async_control_device = AsyncMock(return_value={"commandId": "command-1"})
+        client.access_token_refresh_at.return_value = None
+        client.restore_tokens.return_value = False
+        yield client
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return an aircloudhome config entry added to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="user@example.com",
+        data={CONF_USERNAME: "user@example.com", CONF_PASSWORD: "password"},
+        unique_id="user_example_com",
+    )
+    entry.add_to_hass(hass)
+    return entry
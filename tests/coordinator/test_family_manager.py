@@ -0,0 +1,102 @@
+"""Tests for the aircloudhome family coordinator lifetime."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.aircloudhome.const import DEVICE_REMOVAL_POLLS
+from homeassistant.components.climate import ATTR_CURRENT_TEMPERATURE, DOMAIN as CLIMATE_DOMAIN
+from homeassistant.components.homeassistant import DOMAIN as HOMEASSISTANT_DOMAIN, SERVICE_UPDATE_ENTITY
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+HOME = {"familyId": 1, "familyName": "Home", "role": {"name": "OWNER"}}
+OFFICE = {"familyId": 2, "familyName": "Office", "role": {"name": "OWNER"}}
+
+
+@pytest.fixture
+async def setup_two_families(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api_client: MagicMock,
+    device_record: Callable[..., dict[str, Any]],
+) -> dict[int, list[dict[str, Any]]]:
+    """Set up the entry with one device in each of two family groups; return the idu-lists."""
+    idu_lists = {1: [device_record(1)], 2: [device_record(2)]}
+    mock_api_client.async_get_family_groups.return_value = [HOME, OFFICE]
+    mock_api_client.async_get_idu_list.side_effect = lambda family_id: idu_lists[family_id]
+    assert await async_setup_component(hass, HOMEASSISTANT_DOMAIN, {})
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return idu_lists
+
+
+async def _async_list_family_groups(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
+    """Run the family group listing of the entry."""
+    await config_entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+
+async def _async_update_entity(hass: HomeAssistant, entity_id: str) -> None:
+    """Ask an entity to refresh its coordinator."""
+    await hass.services.async_call(
+        HOMEASSISTANT_DOMAIN, SERVICE_UPDATE_ENTITY, {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+
+def _entity_id_of(hass: HomeAssistant, name: str) -> str:
+    """Return the climate entity ID of a device by its name."""
+    return next(state.entity_id for state in hass.states.async_all(CLIMATE_DOMAIN) if state.name.startswith(name))
+
+
+@pytest.mark.integration
+async def test_family_left_out_once_keeps_updating(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api_client: MagicMock,
+    device_record: Callable[..., dict[str, Any]],
+    setup_two_families: dict[int, list[dict[str, Any]]],
+) -> None:
+    """A family group missing from one listing keeps its coordinator and entities."""
+    entity_id = _entity_id_of(hass, "AC 2")
+
+    mock_api_client.async_get_family_groups.return_value = [HOME]
+    await _async_list_family_groups(hass, config_entry)
+    mock_api_client.async_get_family_groups.return_value = [HOME, OFFICE]
+    await _async_list_family_groups(hass, config_entry)
+
+    setup_two_families[2] = [device_record(2, roomTemperature=19.0, updatedAt=2000)]
+    await _async_update_entity(hass, entity_id)
+    assert hass.states.get(entity_id).attributes[ATTR_CURRENT_TEMPERATURE] == 19.0
+
+
+@pytest.mark.integration
+async def test_removed_family_listed_again_reloads(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_api_client: MagicMock,
+    device_record: Callable[..., dict[str, Any]],
+    setup_two_families: dict[int, list[dict[str, Any]]],
+) -> None:
+    """Entities of a family group whose coordinator was stopped update again once it is listed."""
+    entity_id = _entity_id_of(hass, "AC 2")
+
+    mock_api_client.async_get_family_groups.return_value = [HOME]
+    for _ in range(DEVICE_REMOVAL_POLLS):
+        await _async_list_family_groups(hass, config_entry)
+    assert 2 not in config_entry.runtime_data.coordinator.family_coordinators
+
+    mock_api_client.async_get_family_groups.return_value = [HOME, OFFICE]
+    await _async_list_family_groups(hass, config_entry)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    setup_two_families[2] = [device_record(2, roomTemperature=19.0, updatedAt=2000)]
+    await _async_update_entity(hass, entity_id)
+    assert hass.states.get(entity_id).attributes[ATTR_CURRENT_TEMPERATURE] == 19.0